@@ -0,0 +1,35 @@
+"""Time writing a workbook per compression of the zip archive, against its size.
+
+Run with `python benchmarks/compression.py [rows] [columns]`.
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+from suite import make_tables
+
+from pandas_xlsx_tables import Stats, dfs_to_xlsx_tables
+
+COMPRESSIONS = ("store", "fast", None, "max")
+
+
+if __name__ == "__main__":
+    rows, columns = (int(arg) for arg in (sys.argv[1:] or [100_000, 10]))
+    tables = make_tables(rows, columns, 1)
+    with TemporaryDirectory() as directory:
+        path = f"{directory}/benchmark.xlsx"
+        for compression in COMPRESSIONS:
+            runs = []
+            for _ in range(3):
+                stats = Stats()
+                start = time.perf_counter()
+                dfs_to_xlsx_tables(
+                    tables, path, index=False, compression=compression, stats=stats
+                )
+                runs.append((time.perf_counter() - start, stats.seconds("close")))
+            seconds, close = min(runs)
+            print(
+                f"{str(compression):>5} {rows} x {columns}: {seconds:.2f}s "
+                f"(closing {close:.2f}s), {os.path.getsize(path) / 2**20:.1f}MB"
+            )
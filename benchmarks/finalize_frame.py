@@ -0,0 +1,74 @@
+"""Time the replacement of excel errors and empty cells on a wide table.
+
+The baseline is how errors used to be replaced: a frame wide `replace` with a pass
+over every column per error code, followed by an `astype` copy of every column.
+The single pass version only visits object columns, once each.
+
+Run with `python benchmarks/finalize_frame.py [rows] [columns]`.
+"""
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+from openpyxl.worksheet.table import Table
+
+from pandas_xlsx_tables.from_xlsx_tables import (
+    VALUES_AS_EMPTY_STRING,
+    VALUES_AS_INF,
+    VALUES_AS_NAN,
+    finalize_frame,
+)
+
+REPLACEMENTS = {
+    **{value: "" for value in VALUES_AS_EMPTY_STRING},
+    **{value: np.nan for value in VALUES_AS_NAN},
+    **{value: np.inf for value in VALUES_AS_INF},
+}
+
+
+def wide_frame(rows: int, columns: int) -> pd.DataFrame:
+    """A quarter of the columns are numbers with errors, a quarter are strings with
+    empty cells and the rest are plain floats"""
+    rng = np.random.default_rng(0)
+    data = {}
+    for j in range(columns):
+        if j % 4 == 0:
+            values = rng.random(rows).astype(object)
+            values[::1000] = "#N/A"
+        elif j % 4 == 1:
+            values = np.array([f"s{i}" for i in rng.integers(0, 1000, rows)], object)
+            values[::97] = None
+        else:
+            values = rng.random(rows)
+        data[f"c{j}"] = values
+    return pd.DataFrame(data)
+
+
+def replace_per_code(frame: pd.DataFrame) -> pd.DataFrame:
+    dtypes = frame.dtypes
+    frame = frame.replace(REPLACEMENTS)
+    for col, dtype in zip(frame.columns, dtypes):
+        frame[col] = frame[col].astype(dtype)
+    return frame
+
+
+if __name__ == "__main__":
+    rows, columns = (int(arg) for arg in (sys.argv[1:] or [100_000, 40]))
+    frame = wide_frame(rows, columns)
+    table = Table(displayName="Benchmark", ref="A1:B2")
+    object_columns = int((frame.dtypes == object).sum())
+    cases = {
+        # a replace pass per code over every column, and an astype per column
+        "replace_per_code": (
+            lambda: replace_per_code(frame),
+            len(REPLACEMENTS) * columns + columns,
+        ),
+        # an isin pass per object column
+        "finalize_frame": (lambda: finalize_frame(frame, table, False), object_columns),
+    }
+    times = {}
+    for name, (run, passes) in cases.items():
+        times[name] = min(timeit.repeat(run, number=1, repeat=5))
+        print(f"{name:>16} {rows} x {columns}: {times[name]:.3f}s, {passes} passes")
+    print(f"speedup: {times['replace_per_code'] / times['finalize_frame']:.2f}x")
@@ -0,0 +1,57 @@
+"""Time writing string columns per string storage, against peak memory and size.
+
+The table has unique identifiers, free text with few repeats, a categorical with a
+handful of categories and an object column with a hundred distinct values.
+
+Run with `python benchmarks/strings.py [rows]`.
+"""
+import os
+import sys
+import time
+import tracemalloc
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+
+from pandas_xlsx_tables import dfs_to_xlsx_tables
+
+STORAGES = (None, "shared", "inline", "auto")
+
+
+def string_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": [f"ID-{i:09d}" for i in range(rows)],
+            "text": [f"comment {i} on item" for i in rng.integers(0, rows, rows)],
+            "category": pd.Categorical.from_codes(
+                rng.integers(0, 5, rows), ["north", "east", "south", "west", "none"]
+            ),
+            "code": np.array([f"C{i:03d}" for i in range(100)], object)[
+                rng.integers(0, 100, rows)
+            ],
+        }
+    )
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if sys.argv[1:] else 200_000
+    frame = string_frame(rows)
+    with TemporaryDirectory() as directory:
+        path = f"{directory}/benchmark.xlsx"
+        for constant_memory in (False, True):
+            for strings in STORAGES:
+                options = dict(strings=strings, constant_memory=constant_memory)
+                start = time.perf_counter()
+                dfs_to_xlsx_tables([(frame, "Strings")], path, index=False, **options)
+                seconds = time.perf_counter() - start
+                tracemalloc.start()
+                dfs_to_xlsx_tables([(frame, "Strings")], path, index=False, **options)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(
+                    f"{str(strings):>6}{' constant_memory' * constant_memory:16} "
+                    f"{rows}: {seconds:.2f}s, allocated {peak / 2**20:.1f}MB, "
+                    f"{os.path.getsize(path) / 2**20:.1f}MB"
+                )
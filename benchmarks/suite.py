@@ -0,0 +1,206 @@
+"""Measure the throughput and memory of the readers and the writer.
+
+Workbooks are generated for every combination of rows, columns and tables, with
+the columns cycling through integers, floats, strings, datetimes and floats with
+error cells. Every case runs in a fresh process, so its peak RSS is its own, and
+is then repeated under tracemalloc to measure the peak of allocated memory.
+
+Save the results of a baseline with `--save` and compare a branch against it with
+`--compare`, which exits with an error if a case is slower or uses more memory than
+the threshold allows:
+
+    python benchmarks/suite.py --rows 10000 1000000 --save baseline.json
+    python benchmarks/suite.py --rows 10000 1000000 --compare baseline.json
+
+Pass `--no-tracemalloc` for the largest sizes (up to millions of rows), where
+tracing allocations takes much longer than the case itself.
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+
+from pandas_xlsx_tables import dfs_to_xlsx_tables, xlsx_tables_to_dfs
+
+KINDS = ("int", "float", "string", "datetime", "error")
+CASES = {
+    "write": None,
+    "read-openpyxl": {},
+    "read-read_only": {"read_only": True},
+    "read-xml": {"engine": "xml"},
+}
+METRICS = ("seconds", "peak_rss_mb", "allocated_mb")
+
+
+def make_frame(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """Columns of each kind in turn, error cells are one in a hundred"""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2020-01-01T00:00:00")
+    data = {}
+    for j in range(columns):
+        kind = KINDS[j % len(KINDS)]
+        if kind == "int":
+            values = rng.integers(0, 1_000_000, rows)
+        elif kind == "float":
+            values = rng.random(rows)
+        elif kind == "string":
+            values = np.array([f"s{i}" for i in rng.integers(0, 1000, rows)], object)
+        elif kind == "datetime":
+            values = start + rng.integers(0, 10**8, rows).astype("timedelta64[s]")
+        else:
+            values = rng.random(rows).astype(object)
+            values[::100] = "#N/A"
+        data[f"{kind}{j}"] = values
+    return pd.DataFrame(data)
+
+
+def make_tables(rows: int, columns: int, tables: int) -> list:
+    return [(make_frame(rows, columns, t), f"Table{t}") for t in range(tables)]
+
+
+def run(case: str, path: str, tables: list) -> None:
+    if case == "write":
+        dfs_to_xlsx_tables(tables, path, index=False)
+    else:
+        xlsx_tables_to_dfs(path, index=False, **CASES[case])
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def measure(case: str, path: str, rows, columns, tables, repeat: int, trace: bool):
+    """Run a case in this process, which should be a fresh one. The peak RSS
+    includes the generated frames for the writer."""
+    data = make_tables(rows, columns, tables) if case == "write" else []
+    target = path if case != "write" else f"{path}.{os.getpid()}.xlsx"
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(case, target, data)
+        times.append(time.perf_counter() - start)
+    result = {"seconds": min(times), "peak_rss_mb": peak_rss_mb(), "allocated_mb": None}
+    if trace:
+        tracemalloc.start()
+        run(case, target, data)
+        result["allocated_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    if case == "write":
+        os.remove(target)
+    return result
+
+
+def benchmark(args) -> list:
+    results = []
+    context = get_context("spawn")
+    with TemporaryDirectory() as directory:
+        for rows, columns, tables in product(args.rows, args.columns, args.tables):
+            path = os.path.join(directory, f"{rows}x{columns}x{tables}.xlsx")
+            dfs_to_xlsx_tables(
+                make_tables(rows, columns, tables),
+                path,
+                index=False,
+                constant_memory=True,
+            )
+            for case in args.cases:
+                with ProcessPoolExecutor(1, mp_context=context) as pool:
+                    measured = pool.submit(
+                        measure,
+                        case,
+                        path,
+                        rows,
+                        columns,
+                        tables,
+                        args.repeat,
+                        args.tracemalloc,
+                    ).result()
+                cells = rows * columns * tables
+                result = {
+                    "case": case,
+                    "rows": rows,
+                    "columns": columns,
+                    "tables": tables,
+                    **measured,
+                    "cells_per_second": cells / measured["seconds"],
+                }
+                results.append(result)
+                print(format_result(result), flush=True)
+    return results
+
+
+def format_result(result: dict) -> str:
+    allocated = result["allocated_mb"]
+    return (
+        f"{result['case']:>15} {result['rows']:>9} x {result['columns']:>3} x "
+        f"{result['tables']:>2}: {result['seconds']:8.3f}s "
+        f"{result['cells_per_second'] / 1e6:6.2f}M cells/s "
+        f"rss {result['peak_rss_mb']:8.1f}MB "
+        f"allocated {'-' if allocated is None else f'{allocated:.1f}MB':>10}"
+    )
+
+
+def compare(results: list, baseline: list, threshold: float) -> bool:
+    """Print the ratio to the baseline of every metric, True if none regressed"""
+    key = ("case", "rows", "columns", "tables")
+    expected = {tuple(r[k] for k in key): r for r in baseline}
+    ok = True
+    for result in results:
+        base = expected.get(tuple(result[k] for k in key))
+        if base is None:
+            continue
+        ratios = []
+        for metric in METRICS:
+            if result[metric] is None or not base[metric]:
+                continue
+            ratio = result[metric] / base[metric]
+            regressed = ratio > 1 + threshold
+            ok &= not regressed
+            ratios.append(f"{metric} {ratio:.2f}x{' REGRESSED' if regressed else ''}")
+        print(
+            f"{result['case']:>15} {result['rows']:>9} x {result['columns']:>3} x "
+            f"{result['tables']:>2}: {', '.join(ratios)}"
+        )
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--columns", type=int, nargs="+", default=[10])
+    parser.add_argument("--tables", type=int, nargs="+", default=[1])
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per case, the fastest is kept"
+    )
+    parser.add_argument("--no-tracemalloc", dest="tracemalloc", action="store_false")
+    parser.add_argument("--save", help="write the results to this json file")
+    parser.add_argument("--compare", help="compare to the results in this json file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative increase of a metric that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    results = benchmark(args)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
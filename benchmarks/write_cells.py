@@ -0,0 +1,77 @@
+"""Time writing the cells of a mixed table, typed per column versus per cell.
+
+The per cell baseline is how tables used to be written: an object array of the
+whole frame, with the type of every cell sniffed by xlsxwriter's `write`.
+
+Run with `python benchmarks/write_cells.py [rows] [columns]`.
+"""
+import sys
+import timeit
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+from pandas_xlsx_tables.to_xlsx_table import _columns, _write_rows
+
+
+def mixed_frame(rows: int, columns: int) -> pd.DataFrame:
+    """Integers, floats, floats with missing values, datetimes, booleans and
+    strings, in turn"""
+    rng = np.random.default_rng(0)
+    start = np.datetime64("2020-01-01T00:00:00")
+    data = {}
+    for j in range(columns):
+        kind = j % 6
+        if kind == 0:
+            values = rng.integers(0, 1_000_000, rows)
+        elif kind == 1:
+            values = rng.random(rows)
+        elif kind == 2:
+            values = rng.random(rows)
+            values[::10] = np.nan
+        elif kind == 3:
+            values = start + rng.integers(0, 10**8, rows).astype("timedelta64[s]")
+        elif kind == 4:
+            values = rng.random(rows) > 0.5
+        else:
+            values = np.array([f"s{i}" for i in rng.integers(0, 1000, rows)], object)
+        data[f"c{j}"] = values
+    return pd.DataFrame(data)
+
+
+def per_cell(ws, df: pd.DataFrame) -> None:
+    values = df.fillna("").values
+    for row, cells in enumerate(values, start=1):
+        for col, value in enumerate(cells):
+            ws.write(row, col, value, None)
+
+
+def typed(ws, df: pd.DataFrame) -> None:
+    _write_rows(ws, _columns(df, False)[1], [None] * len(df.columns), False)
+
+
+def run(write, df: pd.DataFrame, path: str) -> None:
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+    write(wb.add_worksheet(), df)
+    wb.close()
+
+
+if __name__ == "__main__":
+    rows, columns = (int(arg) for arg in (sys.argv[1:] or [200_000, 20]))
+    frame = mixed_frame(rows, columns)
+    with TemporaryDirectory() as directory:
+        path = f"{directory}/benchmark.xlsx"
+        times = {
+            write.__name__: min(
+                timeit.repeat(lambda: run(write, frame, path), number=1, repeat=3)
+            )
+            for write in (per_cell, typed)
+        }
+    for name, seconds in times.items():
+        print(
+            f"{name:>8} {rows} x {columns}: {seconds:.2f}s, "
+            f"{rows * columns / seconds / 1e6:.2f}M cells/s"
+        )
+    print(f"speedup: {times['per_cell'] / times['typed']:.2f}x")
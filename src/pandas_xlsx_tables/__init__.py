@@ -9,12 +9,32 @@ except PackageNotFoundError:  # pragma: no cover
 finally:
     del version, PackageNotFoundError
 
-from .from_xlsx_tables import xlsx_table_to_df, xlsx_tables_to_dfs
+from .aio import aread_xlsx_table, aread_xlsx_tables, awrite_xlsx_tables
+from .cache import MemoryCache, TableCache
+from .from_xlsx_tables import (
+    XlsxTables,
+    iter_xlsx_table,
+    xlsx_table_to_arrow,
+    xlsx_table_to_df,
+    xlsx_tables_to_arrow,
+    xlsx_tables_to_dfs,
+)
+from .stats import Stats
 from .to_xlsx_table import df_to_xlsx_table, dfs_to_xlsx_tables
 
 __all__ = [
+    "MemoryCache",
+    "Stats",
+    "TableCache",
+    "XlsxTables",
+    "aread_xlsx_table",
+    "aread_xlsx_tables",
+    "awrite_xlsx_tables",
     "df_to_xlsx_table",
     "dfs_to_xlsx_tables",
+    "iter_xlsx_table",
+    "xlsx_table_to_arrow",
     "xlsx_table_to_df",
+    "xlsx_tables_to_arrow",
     "xlsx_tables_to_dfs",
 ]
@@ -0,0 +1,164 @@
+import asyncio
+import inspect
+import os
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterable, Optional, Tuple, cast
+
+from pandas import DataFrame
+
+from .from_xlsx_tables import xlsx_table_to_df, xlsx_tables_to_dfs
+from .to_xlsx_table import dfs_to_xlsx_tables
+
+# Size of the chunks in which byte streams are read and written
+CHUNK_BYTES = 1 << 16
+# Uploads up to this size are buffered in memory, larger ones in a temporary file
+SPOOL_BYTES = 8 << 20
+# Chunks of written bytes that wait for the consumer
+QUEUE_CHUNKS = 4
+
+
+async def aread_xlsx_table(
+    file, table: str, executor: Optional[Executor] = None, **kwargs: Any
+) -> DataFrame:
+    """Get a table from a given workbook without blocking the event loop.
+
+    `file` can be a path, bytes, a file object, an async iterable of bytes such as
+    a request body stream, or an object with an async `read` method such as an
+    uploaded file. A workbook is a zip archive, which can not be read front to
+    back, so streams are buffered first: in memory up to 8MB, and in a temporary
+    file beyond that. Decoding runs in `executor`, by default the one of the event
+    loop. A process pool can only be used with a path. See `xlsx_table_to_df` for
+    the other arguments.
+
+    >>> df = await aread_xlsx_table(request.stream(), "Table1")
+    """
+    return await _read(partial(xlsx_table_to_df, table=table, **kwargs), file, executor)
+
+
+async def aread_xlsx_tables(
+    file, executor: Optional[Executor] = None, **kwargs: Any
+) -> Dict[str, DataFrame]:
+    """Get all tables from a given workbook without blocking the event loop.
+
+    See `aread_xlsx_table` for `file` and `executor`, and `xlsx_tables_to_dfs` for
+    the other arguments.
+    """
+    return await _read(partial(xlsx_tables_to_dfs, **kwargs), file, executor)
+
+
+async def awrite_xlsx_tables(
+    input: Iterable[Tuple[Any, str]],
+    executor: Optional[Executor] = None,
+    chunk_size: int = CHUNK_BYTES,
+    **kwargs: Any,
+) -> AsyncIterator[bytes]:
+    """Convert multiple dataframes to an excel file, as an async iterator of bytes.
+
+    The workbook is written in `executor`, by default the one of the event loop,
+    which has to run threads. The zip archive is streamed out while it is written,
+    in chunks of about `chunk_size` bytes, and writing waits for the consumer, so
+    the file is never held in memory as a whole. If the iteration is stopped, the
+    rest of the workbook is discarded. See `dfs_to_xlsx_tables` for the other
+    arguments.
+
+    >>> return StreamingResponse(awrite_xlsx_tables([(df, "Table1")]))
+    """
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(QUEUE_CHUNKS)
+    stream = _QueueStream(loop, queue, chunk_size)
+    future = loop.run_in_executor(executor, _write, stream, input, kwargs)
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            yield chunk
+        await future
+    finally:
+        if not future.done():
+            # the writer discards its next writes, a write that waits for the
+            # queue is unblocked by emptying it
+            stream.cancel()
+            while not queue.empty():
+                queue.get_nowait()
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+
+async def _read(read, file, executor: Optional[Executor]):
+    loop = asyncio.get_running_loop()
+    if isinstance(file, (str, os.PathLike)):
+        return await loop.run_in_executor(executor, read, file)
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return await loop.run_in_executor(executor, read, BytesIO(file))
+    if not hasattr(file, "__aiter__") and not inspect.iscoroutinefunction(
+        getattr(file, "read", None)
+    ):
+        return await loop.run_in_executor(executor, read, file)
+
+    with SpooledTemporaryFile(SPOOL_BYTES) as spooled:
+        async for chunk in _iter_bytes(file):
+            spooled.write(chunk)
+        spooled.seek(0)
+        return await loop.run_in_executor(executor, read, spooled)
+
+
+async def _iter_bytes(stream) -> AsyncIterator[bytes]:
+    if hasattr(stream, "__aiter__"):
+        async for chunk in stream:
+            yield chunk
+    else:
+        while True:
+            chunk = await stream.read(CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+
+
+def _write(stream: "_QueueStream", input, kwargs: Dict[str, Any]) -> None:
+    try:
+        # zipfile only writes and flushes, as it does for any unseekable file
+        dfs_to_xlsx_tables(input, cast(BinaryIO, stream), **kwargs)
+        stream.flush(final=True)
+    finally:
+        if not stream.cancelled.is_set():
+            stream.put(None)
+
+
+class _QueueStream:
+    """Write-only, unseekable file that hands its bytes to an asyncio queue.
+
+    It is written from a worker thread, which blocks while the queue is full.
+    """
+
+    def __init__(self, loop, queue: asyncio.Queue, chunk_size: int):
+        self.loop = loop
+        self.queue = queue
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+        self.cancelled = threading.Event()
+
+    def write(self, data) -> int:
+        if self.cancelled.is_set():
+            # the consumer stopped, the rest of the workbook is discarded
+            return len(data)
+        self.buffer += data
+        if len(self.buffer) >= self.chunk_size:
+            self.flush(final=True)
+        return len(data)
+
+    def flush(self, final: bool = False) -> None:
+        # zipfile flushes after every member, only hand over full chunks
+        if not final or not self.buffer or self.cancelled.is_set():
+            return
+        chunk, self.buffer = bytes(self.buffer), bytearray()
+        self.put(chunk)
+
+    def put(self, chunk: Optional[bytes]) -> None:
+        asyncio.run_coroutine_threadsafe(self.queue.put(chunk), self.loop).result()
+
+    def cancel(self) -> None:
+        self.cancelled.set()
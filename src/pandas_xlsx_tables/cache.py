@@ -0,0 +1,251 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Protocol, Tuple, TypeVar
+
+import pandas as pd
+
+from . import __version__
+
+# Size of the blocks in which file objects are hashed
+HASH_BLOCK_SIZE = 1 << 20
+MAX_CACHE_BYTES = 1 << 30
+MAX_MEMORY_BYTES = 256 << 20
+SUFFIX = ".pickle"
+
+K = TypeVar("K", bound=Hashable)
+
+
+class Cache(Protocol[K]):
+    """A cache of decoded tables as used by the readers, such as `TableCache` and
+    `MemoryCache`."""
+
+    def key(self, file, *options: Any) -> K:
+        """Key of the tables read from `file` with `options`."""
+
+    def get(self, key: K) -> Optional[Any]:
+        """Cached tables for `key`, or None on a miss."""
+
+    def put(self, key: K, value: Any) -> None:
+        """Store tables for `key`."""
+
+
+def identify(file) -> Tuple:
+    """Absolute path, modification time and size of a workbook path, or a hash of
+    the content of a file object."""
+    if isinstance(file, (str, os.PathLike)):
+        stat = os.stat(file)
+        return os.path.abspath(file), stat.st_mtime_ns, stat.st_size
+    digest = hashlib.sha256()
+    position = file.tell()
+    for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+        digest.update(block)
+    file.seek(position)
+    return (digest.hexdigest(),)
+
+
+class TableCache:
+    """Cache of decoded tables in a directory, shared between processes.
+
+    Entries are keyed on the workbook and the reading options. A workbook given as a
+    path is identified by its absolute path, modification time and size, so saving
+    the workbook invalidates its entries without reading it. A file object is
+    identified by a hash of its content. Stale entries are never read again and are
+    evicted in least recently used order once the directory holds more than
+    `max_bytes`. Call `clear` to remove all entries.
+
+    Tables are stored as pickles, which restore dtypes and indexes exactly and
+    load in milliseconds. The keys include the versions of pandas and of this
+    package, and entries that fail to load are removed and read again. Only use a
+    directory that is not writable by others.
+
+    >>> cache = TableCache("~/.cache/pandas-xlsx-tables")
+    >>> df = xlsx_table_to_df("my_file.xlsx", "Table1", cache=cache)
+    """
+
+    def __init__(self, directory, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = os.path.expanduser(os.fspath(directory))
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, file, *options: Any) -> str:
+        """Key of the tables read from `file` with `options`, by the current
+        versions of pandas and this package."""
+        versions = pd.__version__, __version__
+        return hashlib.sha256(
+            repr((identify(file), versions, options)).encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached tables for `key`, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # truncated, or pickled by other versions of its modules
+            _remove(path)
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store tables for `key` and evict the least recently used entries."""
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic, so other processes never read a partial entry
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond `max_bytes`."""
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        for _, path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for _, path, _ in self._entries():
+            _remove(path)
+
+    @property
+    def size(self) -> int:
+        """Total size of the entries, in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def _entries(self) -> List[Tuple[int, str, int]]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+        return entries
+
+
+class MemoryCache:
+    """Thread-safe cache of decoded tables in memory, bounded by bytes.
+
+    It is used like a `TableCache`, but is local to the process and returns a copy
+    of the cached tables, so callers can not change the cached data. Entries of a
+    workbook path are dropped as soon as its modification time or size changes, and
+    the least recently used entries are evicted once the tables take more than
+    `max_bytes`. Tables larger than that are not cached. The counters `hits`,
+    `misses` and `evictions` tell how effective the cache is.
+
+    >>> cache = MemoryCache(max_bytes=512 << 20)
+    >>> df = xlsx_table_to_df("my_file.xlsx", "Table1", cache=cache)
+    >>> cache.hits, cache.misses
+    (0, 1)
+    """
+
+    def __init__(self, max_bytes: int = MAX_MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._stamps: Dict[str, Tuple] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def key(self, file, *options: Any) -> Tuple:
+        """Key of the tables read from `file` with `options`."""
+        identity = identify(file)
+        with self._lock:
+            if len(identity) == 3 and self._stamps.get(identity[0]) != identity[1:]:
+                self._stamps[identity[0]] = identity[1:]
+                for key in [k for k in self._entries if k[0][0] == identity[0]]:
+                    self._remove(key)
+        return identity, options
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """A copy of the cached tables for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy(entry[0])
+
+    def put(self, key: Tuple, value: Any) -> None:
+        """Store a copy of tables for `key` and evict the least recently used
+        entries."""
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        value = _copy(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = value, size
+            self._size += size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._stamps.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached tables, in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Tuple) -> None:
+        _, size = self._entries.pop(key)
+        self._size -= size
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _nbytes(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return sum(_nbytes(df) for df in value.values())
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    return {name: df.copy() for name, df in value.items()}
@@ -1,17 +1,56 @@
-from itertools import chain, cycle
-from typing import Iterable, Literal, Union
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+)
+from zipfile import ZipFile
 
-import pandas as pd
 import numpy as np
+import pandas as pd
 from openpyxl import load_workbook
+from openpyxl.utils.datetime import WINDOWS_EPOCH
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet.table import Table
 from pandas import DataFrame
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+    pandas_dtype,
+)
 from pandas.core.dtypes.common import is_list_like
 
+from .cache import Cache
+from .stats import Stats, timed
+from .xml_reader import TablePart, TableSelection, XmlWorkbook, select_table
+
+if TYPE_CHECKING:
+    import pyarrow
+
 Inf = np.inf
 NaN = np.nan
 
+Engine = Literal["openpyxl", "xml"]
+Errors = Literal["raise", "coerce"]
+
+VALUES_AS_NAN = {"#NUM!", "#VALUE!", "#N/A", "#NAME?", "#REF!", "#NULL!"}
+VALUES_AS_INF = {"#DIV/0!"}
+VALUES_AS_EMPTY_STRING = {None}
+
+CHUNKSIZE = 10_000
+
 
 class TableNotFound(Exception):
     pass
@@ -21,31 +60,197 @@ def table_to_df(
     ws: ReadOnlyWorksheet,
     table: Table,
     index,
-    values_as_nan={"#NUM!", "#VALUE!", "#N/A", "#NAME?", "#REF!", "#NULL!"},
-    values_as_inf={"#DIV/0!"},
-    values_as_empty_string={None},
+    values_as_nan=VALUES_AS_NAN,
+    values_as_inf=VALUES_AS_INF,
+    values_as_empty_string=VALUES_AS_EMPTY_STRING,
+    dtypes: Optional[Mapping[str, Any]] = None,
+    errors: Errors = "raise",
+    epoch: datetime = WINDOWS_EPOCH,
+    usecols: Optional[Iterable[str]] = None,
+    skiprows: int = 0,
+    nrows: Optional[int] = None,
+    stats: Optional[Stats] = None,
 ) -> pd.DataFrame:
-    columns = [col.name for col in table.tableColumns]
-    data_rows = ws[table.ref][
-        (table.headerRowCount or 0) : (
-            -table.totalsRowCount if table.totalsRowCount is not None else None
+    selection = select_table(table, usecols, skiprows, nrows)
+    with timed(stats, table.displayName, "decode") as counts:
+        data = iter_selection(ws, selection)
+        frame = DataFrame(data, columns=selection.columns, index=None)
+        counts.update(rows=len(frame), cells=frame.size)
+    with timed(stats, table.displayName, "finalize"):
+        return finalize_frame(
+            frame,
+            table,
+            index,
+            values_as_nan,
+            values_as_inf,
+            values_as_empty_string,
+            dtypes,
+            errors,
+            epoch,
         )
-    ]
-    data = ((cell.value for cell in row) for row in data_rows)
-    replacements = chain(
-        zip(values_as_empty_string, cycle([""])),
-        zip(values_as_nan, cycle([NaN])),
-        zip(values_as_inf, cycle([Inf])),
+
+
+def iter_selection(ws: ReadOnlyWorksheet, selection: TableSelection) -> Iterator:
+    """Iterate the values of the selected rows and columns of a table."""
+    positions = selection.positions
+    if not positions or selection.first_row > selection.last_row:
+        return iter(())
+    # only iterate the rows and columns within the selection, excluding header and
+    # totals
+    rows = ws.iter_rows(
+        min_row=selection.first_row,
+        max_row=selection.last_row,
+        min_col=selection.min_col + positions[0],
+        max_col=selection.min_col + positions[-1],
+        values_only=True,
     )
-    frame = DataFrame(data, columns=columns, index=None)
-    dtypes = frame.dtypes
-    frame = frame.replace({k: r for k, r in replacements})
-    for col, dtype in zip(frame.columns, dtypes):
-        frame[col] = frame[col].astype(dtype)
+    if len(positions) == positions[-1] - positions[0] + 1:
+        return rows
+    offsets = [p - positions[0] for p in positions]
+    return ([row[i] for i in offsets] for row in rows)
+
+
+def convert_column(
+    column: pd.Series,
+    dtype,
+    errors: Errors = "raise",
+    epoch: datetime = WINDOWS_EPOCH,
+) -> pd.Series:
+    """Convert a decoded column to `dtype`, empty cells and errors become missing.
+
+    Numbers are converted to datetimes as excel serial dates. Integer dtypes do not
+    truncate: with `errors="coerce"` values that can not be converted to a number,
+    an integer or a datetime become missing too, and integer columns with missing
+    values are returned as float. Strings keep missing values as NaN, and bool
+    columns can not hold them, use "boolean" for that.
+    """
+    dtype = pandas_dtype(dtype)
+    if column.dtype == dtype:
+        return column
+    try:
+        if is_datetime64_any_dtype(dtype):
+            if is_numeric_dtype(column):
+                return pd.to_datetime(
+                    column, unit="D", origin=pd.Timestamp(epoch), errors=errors
+                ).astype(dtype)
+            return pd.to_datetime(column, errors=errors).astype(dtype)
+        if is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+            numbers = pd.to_numeric(column, errors=errors)
+            if not is_integer_dtype(dtype):
+                return numbers.astype(dtype)
+            fractional = numbers.notna() & (numbers % 1 != 0)
+            if fractional.any():
+                if errors == "raise":
+                    raise ValueError("column contains values that are not integers")
+                numbers = numbers.mask(fractional)
+            if isinstance(dtype, np.dtype) and numbers.isna().any():
+                if errors == "coerce":
+                    return numbers
+                raise ValueError("column contains empty cells or errors")
+            return numbers.astype(dtype)
+        missing = column.isna()
+        if missing.any():
+            if isinstance(dtype, np.dtype) and dtype.kind in "US":
+                return column.where(missing, column.astype(dtype)).astype(object)
+            if isinstance(dtype, np.dtype) and dtype.kind == "b":
+                raise ValueError(
+                    'column contains empty cells or errors, use "boolean" to keep '
+                    "them as missing values"
+                )
+        return column.astype(dtype)
+    except (ValueError, TypeError) as e:
+        raise ValueError(
+            f"Column '{column.name}' can not be converted to {dtype}: {e}"
+        ) from e
+
+
+def finalize_column(
+    column: pd.Series,
+    values_as_nan=VALUES_AS_NAN,
+    values_as_inf=VALUES_AS_INF,
+    values_as_empty_string=VALUES_AS_EMPTY_STRING,
+    dtype=None,
+    errors: Errors = "raise",
+    epoch: datetime = WINDOWS_EPOCH,
+) -> pd.Series:
+    """Replace excel errors and empty cells in a column and convert its dtype.
+
+    Only object columns can contain errors or empty cells. These are found in a
+    single pass, after which the column is converted to `dtype` or, if not given,
+    its dtype is inferred once. Empty cells become NaN/NaT if the column turns out
+    to be numeric or datetime, and an empty string otherwise. With a `dtype` they
+    are always missing.
+    """
+    empty: Iterable[int] = []
+    if column.dtype == object:
+        replacements = {
+            **dict.fromkeys(values_as_empty_string, None),
+            **dict.fromkeys(values_as_nan, NaN),
+            **dict.fromkeys(values_as_inf, Inf),
+        }
+        values = column.to_numpy()
+        positions = np.flatnonzero(column.isin(list(replacements)).to_numpy())
+        if len(positions):
+            found = values[positions]
+            empty = positions[[v in values_as_empty_string for v in found]]
+            values = values.copy()
+            values[positions] = [replacements[v] for v in found]
+            column = pd.Series(values, index=column.index, name=column.name)
+        if dtype is None:
+            column = column.infer_objects()
+    if dtype is not None:
+        column = convert_column(column, dtype, errors, epoch)
+    if dtype is None and column.dtype == object and len(empty):  # type: ignore
+        column.iloc[empty] = ""
+    return column
+
+
+def finalize_frame(
+    frame: pd.DataFrame,
+    table: Table,
+    index,
+    values_as_nan=VALUES_AS_NAN,
+    values_as_inf=VALUES_AS_INF,
+    values_as_empty_string=VALUES_AS_EMPTY_STRING,
+    dtypes: Optional[Mapping[str, Any]] = None,
+    errors: Errors = "raise",
+    epoch: datetime = WINDOWS_EPOCH,
+) -> pd.DataFrame:
+    """Replace excel errors and empty cells, convert dtypes and set the index.
+
+    See `finalize_column` for the handling of each column.
+    """
+    dtypes = dtypes or {}
+    columns = list(frame.columns)
+    frame = DataFrame(
+        {
+            name: finalize_column(
+                column,
+                values_as_nan,
+                values_as_inf,
+                values_as_empty_string,
+                dtypes.get(name),
+                errors,
+                epoch,
+            )
+            for name, column in frame.items()
+        },
+        columns=columns,
+    )
+
+    return set_table_index(frame, table, index)
+
 
+def set_table_index(frame: pd.DataFrame, table: Table, index) -> pd.DataFrame:
+    """Set the index of a decoded table, see `xlsx_tables_to_dfs` for `index`."""
+    columns = list(frame.columns)
     if index:
         if index == "auto":
-            if table.tableStyleInfo.showFirstColumn:
+            if (
+                table.tableStyleInfo
+                and table.tableStyleInfo.showFirstColumn
+                and columns[:1] == [table.tableColumns[0].name]
+            ):
                 frame = frame.set_index(columns[0])
         elif index is False:
             pass
@@ -56,47 +261,620 @@ def table_to_df(
     return frame
 
 
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Reading arrow tables requires pyarrow, install it with "
+            "`pip install pandas-xlsx-tables[arrow]`."
+        ) from e
+    return pyarrow
+
+
+def _column_to_arrow(pa, column: pd.Series):
+    try:
+        return pa.Array.from_pandas(column)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # mixed columns become strings, missing values stay null
+        return pa.Array.from_pandas(column.where(column.isna(), column.astype(str)))
+
+
+def _table_not_found(table: str, names: Iterable[str]) -> TableNotFound:
+    all_tables = {f"'{name}'" for name in names}
+    return TableNotFound(
+        f"Table '{table}' could not be found in the workbook. "
+        f"Choose from {', '.join(all_tables)}."
+    )
+
+
+class XlsxTables(Mapping[str, DataFrame]):
+    """Lazy, read-only mapping of the tables in a workbook.
+
+    The file is opened once and only the workbook, relationship and table parts are
+    read up front, so listing the tables is cheap even for huge workbooks. A table
+    is only decoded when it is requested, using `engine` ("openpyxl" streams the
+    rows in read-only mode, "xml" decodes the worksheet xml directly). The phases of
+    decoding are recorded in `stats`, if given, except in worker processes.
+
+    >>> with XlsxTables("my_file.xlsx") as tables:
+    ...     list(tables)
+    ...     df = tables["Table1"]
+    ['Table1', 'Table2']
+    """
+
+    def __init__(
+        self, file, engine: Engine = "openpyxl", stats: Optional[Stats] = None
+    ):
+        if engine not in ("openpyxl", "xml"):
+            raise ValueError(f"Unknown engine '{engine}', use 'openpyxl' or 'xml'.")
+        self.file = file
+        self.engine = engine
+        self.stats = stats
+        with timed(stats, None, "index"):
+            self._archive = ZipFile(file)
+            self._workbook = XmlWorkbook(self._archive)
+        self._wb = None
+
+    @property
+    def index(self) -> Dict[str, TablePart]:
+        """Location, range and columns of each table, by table name."""
+        return self._workbook.tables
+
+    def __getitem__(self, name: str) -> DataFrame:
+        return self.read(name)
+
+    def __contains__(self, name) -> bool:
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.file!r}, tables={list(self)})"
+
+    def read(
+        self,
+        name: str,
+        index: Union[Literal["auto"], int, Iterable[int]] = "auto",
+        dtypes: Optional[Mapping[str, Any]] = None,
+        errors: Errors = "raise",
+        usecols: Optional[Iterable[str]] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+    ) -> DataFrame:
+        """Decode a single table, see `xlsx_tables_to_dfs` for the arguments."""
+        return self.read_all(
+            [name],
+            index,
+            dtypes,
+            errors,
+            usecols=usecols,
+            skiprows=skiprows,
+            nrows=nrows,
+        )[name]
+
+    def read_all(
+        self,
+        names: Optional[Iterable[str]] = None,
+        index: Union[Literal["auto"], int, Iterable[int]] = "auto",
+        dtypes: Optional[Mapping[str, Any]] = None,
+        errors: Errors = "raise",
+        workers: Optional[int] = None,
+        usecols: Optional[Iterable[str]] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+    ) -> Dict[str, DataFrame]:
+        """Decode several tables, by default all of them.
+
+        With the xml engine each worksheet is parsed only once, for all of its tables.
+        With `workers` larger than one, the worksheets are decoded in a process pool.
+        Every worker opens the file itself, so only the resulting frames are sent
+        back. This requires `file` to be a path, otherwise the tables are decoded
+        sequentially.
+        """
+        names = list(self.index if names is None else names)
+        if usecols is not None:
+            usecols = list(usecols)
+        for name in names:
+            if name not in self.index:
+                raise _table_not_found(name, self.index)
+
+        per_sheet = defaultdict(list)
+        for name in names:
+            per_sheet[self.index[name].path].append(name)
+        if (
+            workers is not None
+            and workers > 1
+            and len(per_sheet) > 1
+            and isinstance(self.file, (str, os.PathLike))
+        ):
+            if not isinstance(index, (str, int)):
+                index = list(index)
+            with ProcessPoolExecutor(min(workers, len(per_sheet))) as pool:
+                futures = [
+                    pool.submit(
+                        _read_tables_from_file,
+                        self.file,
+                        self.engine,
+                        sheet_names,
+                        index,
+                        None if dtypes is None else dict(dtypes),
+                        errors,
+                        usecols,
+                        skiprows,
+                        nrows,
+                    )
+                    for sheet_names in per_sheet.values()
+                ]
+                decoded = {}
+                for future in futures:
+                    decoded.update(future.result())
+            return {name: decoded[name] for name in names}
+
+        if self.engine == "xml":
+            frames = {}
+            for path, sheet_names in per_sheet.items():
+                label = ", ".join(sheet_names)
+                with timed(self.stats, label, "decode") as counts:
+                    decoded = self._workbook.read_tables(
+                        sheet_names,
+                        dtypes,
+                        VALUES_AS_NAN,
+                        VALUES_AS_INF,
+                        usecols=usecols,
+                        skiprows=skiprows,
+                        nrows=nrows,
+                    )
+                    lengths = [
+                        (len(next(iter(arrays.values()), ())), len(arrays))
+                        for arrays in decoded.values()
+                    ]
+                    counts.update(
+                        rows=sum(rows for rows, _ in lengths),
+                        cells=sum(rows * columns for rows, columns in lengths),
+                        bytes=self._archive.getinfo(path).file_size,
+                    )
+                for name, arrays in decoded.items():
+                    with timed(self.stats, name, "finalize"):
+                        frames[name] = finalize_frame(
+                            DataFrame(arrays),
+                            self.index[name].table,
+                            index,
+                            dtypes=dtypes,
+                            errors=errors,
+                            epoch=self._workbook.epoch,
+                        )
+            return {name: frames[name] for name in names}
+
+        wb = self._read_only_workbook()
+        return {
+            name: table_to_df(
+                wb[self.index[name].sheet],
+                self.index[name].table,
+                index,
+                dtypes=dtypes,
+                errors=errors,
+                epoch=wb.epoch,
+                usecols=usecols,
+                skiprows=skiprows,
+                nrows=nrows,
+                stats=self.stats,
+            )
+            for name in names
+        }
+
+    def iter_table(
+        self,
+        name: str,
+        chunksize: int = CHUNKSIZE,
+        index: Union[Literal["auto"], int, Iterable[int]] = "auto",
+        dtypes: Optional[Mapping[str, Any]] = None,
+        errors: Errors = "raise",
+        usecols: Optional[Iterable[str]] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+    ) -> Iterator[DataFrame]:
+        """Decode a table in chunks of at most `chunksize` rows.
+
+        The rows are streamed from the worksheet in read-only mode, whatever the
+        engine, so only one chunk is held in memory at a time. See
+        `iter_xlsx_table` for the dtypes of the chunks.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+        if name not in self.index:
+            raise _table_not_found(name, self.index)
+        table = self.index[name].table
+        selection = select_table(table, usecols, skiprows, nrows)
+        wb = self._read_only_workbook()
+        return self._iter_chunks(
+            iter_selection(wb[self.index[name].sheet], selection),
+            selection.columns,
+            table,
+            chunksize,
+            index,
+            dict(dtypes or {}),
+            errors,
+            wb.epoch,
+        )
+
+    @staticmethod
+    def _iter_chunks(
+        rows, columns, table, chunksize, index, dtypes, errors, epoch
+    ) -> Iterator[DataFrame]:
+        start = 0
+        while True:
+            chunk = DataFrame(list(islice(rows, chunksize)), columns=columns)
+            if start and chunk.empty:
+                return
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            chunk = finalize_frame(
+                chunk, table, False, dtypes=dtypes, errors=errors, epoch=epoch
+            )
+            if not start:
+                # later chunks are converted to the dtypes of the first one, integers
+                # become floats so later empty cells and fractions fit
+                chunk = chunk.astype(
+                    {
+                        column: np.float64
+                        for column, dtype in chunk.dtypes.items()
+                        if column not in dtypes
+                        and isinstance(dtype, np.dtype)
+                        and dtype.kind in "iu"
+                    }
+                )
+                dtypes = {**chunk.dtypes.to_dict(), **dtypes}
+            yield set_table_index(chunk, table, index)
+            if len(chunk) < chunksize:
+                return
+            start += len(chunk)
+
+    def read_arrow(
+        self,
+        names: Optional[Iterable[str]] = None,
+        dtypes: Optional[Mapping[str, Any]] = None,
+        errors: Errors = "raise",
+    ) -> Dict[str, "pyarrow.Table"]:
+        """Decode tables to pyarrow tables, by default all of them.
+
+        The tables are decoded with the xml engine and every column is converted to
+        an arrow array on its own, after which its decoded cells are released.
+        Errors and empty cells are handled as for DataFrames, and columns with both
+        numbers and text become text. There is no index, all columns are kept.
+        """
+        pa = _import_pyarrow()
+        names = list(self.index if names is None else names)
+        for name in names:
+            if name not in self.index:
+                raise _table_not_found(name, self.index)
+
+        decoded = self._workbook.read_tables(
+            names, dtypes, VALUES_AS_NAN, VALUES_AS_INF
+        )
+        tables = {}
+        for name in names:
+            arrays = decoded.pop(name)
+            columns = list(arrays)
+            tables[name] = pa.Table.from_arrays(
+                [
+                    _column_to_arrow(
+                        pa,
+                        finalize_column(
+                            pd.Series(arrays.pop(column), name=column, copy=False),
+                            dtype=(dtypes or {}).get(column),
+                            errors=errors,
+                            epoch=self._workbook.epoch,
+                        ),
+                    )
+                    for column in columns
+                ],
+                names=columns,
+            )
+        return tables
+
+    def _read_only_workbook(self):
+        if self._wb is None:
+            with timed(self.stats, None, "load"):
+                self._wb = load_workbook(
+                    filename=self.file,
+                    read_only=True,
+                    keep_vba=False,
+                    data_only=True,
+                    keep_links=False,
+                )
+        return self._wb
+
+    def close(self) -> None:
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+        self._archive.close()
+
+    def __enter__(self) -> "XlsxTables":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _read_tables_from_file(
+    file, engine, names, index, dtypes, errors, usecols, skiprows, nrows
+):
+    """Worker for `XlsxTables.read_all`, runs in a separate process."""
+    with XlsxTables(file, engine) as tables:
+        return tables.read_all(
+            names,
+            index,
+            dtypes,
+            errors,
+            usecols=usecols,
+            skiprows=skiprows,
+            nrows=nrows,
+        )
+
+
+def _cache_options(index, dtypes, errors, usecols, skiprows, nrows) -> tuple:
+    """Arguments that change the decoded tables, the engine does not. Hashable, so
+    they can be part of the key of a `MemoryCache`."""
+    index = tuple(index) if is_list_like(index) else index
+    dtypes = None if dtypes is None else tuple(sorted(map(str, dict(dtypes).items())))
+    usecols = None if usecols is None else tuple(usecols)
+    return index, dtypes, errors, usecols, skiprows, nrows
+
+
 def xlsx_tables_to_dfs(
-    file, index: Union[Literal["auto"], int, Iterable[int]] = "auto"
+    file,
+    index: Union[Literal["auto"], int, Iterable[int]] = "auto",
+    read_only: bool = False,
+    engine: Engine = "openpyxl",
+    dtypes: Optional[Mapping[str, Any]] = None,
+    errors: Errors = "raise",
+    workers: Optional[int] = None,
+    usecols: Optional[Iterable[str]] = None,
+    skiprows: int = 0,
+    nrows: Optional[int] = None,
+    cache: Optional[Cache] = None,
+    stats: Optional[Stats] = None,
 ):
     """Get all tables from a given workbook. Returns a dictionary of tables.
     Requires a filename, which includes the file path and filename.
 
+    With `read_only=True` the workbook is streamed: table definitions are read from
+    the table parts and only the rows within each table range are parsed, so memory
+    use is bounded by the table being decoded instead of by the whole workbook.
+
+    With `engine="xml"` the worksheet xml is decoded directly into one array per
+    column, skipping openpyxl cells altogether. This is always streaming and much
+    faster for large tables.
+
+    `dtypes` maps column names to a dtype, for any table with that column. Empty
+    cells and errors in these columns become missing values. With the xml engine,
+    numeric and datetime columns are decoded straight into typed arrays. With
+    `errors="raise"` (default) a value that can not be converted raises a
+    ValueError, with `errors="coerce"` it becomes missing.
+
+    With `workers` larger than one the worksheets are decoded in parallel, in a pool
+    of that many processes. This implies streaming and requires `file` to be a path.
+
+    `usecols` selects columns by name, which must be in every table, `skiprows`
+    skips the first data rows and `nrows` limits the number of rows read. The cells
+    outside of this selection are not decoded, and with `read_only=True` or
+    `engine="xml"` the worksheet is only read up to the last selected row. With
+    `index="auto"` the first column only becomes the index if it is selected.
+
+    With a `cache`, the tables are stored after decoding and returned from the cache
+    while the workbook and the arguments are unchanged. See `TableCache` for a cache
+    on disk and `MemoryCache` for one in memory, any object with their `key`, `get`
+    and `put` methods will do.
+
+    With `stats`, the wall time of loading the workbook and of decoding and
+    finalizing every table is recorded, see `Stats`. These phases are also logged
+    at DEBUG level.
+
     Inspired by:
     https://github.com/pandas-dev/pandas/issues/24862#issuecomment-458885960
     https://stackoverflow.com/questions/43941365/openpyxl-read-tables-from-existing-data-book-example
     """
+    if cache is not None:
+        usecols = None if usecols is None else list(usecols)
+        key = cache.key(
+            file, None, *_cache_options(index, dtypes, errors, usecols, skiprows, nrows)
+        )
+        tables = cache.get(key)
+        if tables is None:
+            tables = xlsx_tables_to_dfs(
+                file,
+                index,
+                read_only,
+                engine,
+                dtypes,
+                errors,
+                workers,
+                usecols,
+                skiprows,
+                nrows,
+                stats=stats,
+            )
+            cache.put(key, tables)
+        return tables
 
-    # Load the workbook, from the filename, setting read_only to False
-    wb = load_workbook(
-        filename=file, read_only=False, keep_vba=False, data_only=True, keep_links=False
-    )
+    if read_only or engine != "openpyxl" or (workers is not None and workers > 1):
+        with XlsxTables(file, engine, stats) as tables:
+            return tables.read_all(
+                None, index, dtypes, errors, workers, usecols, skiprows, nrows
+            )
+
+    # Load the workbook, from the filename
+    with timed(stats, None, "load") as counts:
+        wb = load_workbook(
+            filename=file,
+            read_only=False,
+            keep_vba=False,
+            data_only=True,
+            keep_links=False,
+        )
+        if isinstance(file, (str, os.PathLike)):
+            counts["bytes"] = os.path.getsize(file)
 
     # Initialize the dictionary of tables
     return {
-        name: table_to_df(ws, tbl, index)
+        name: table_to_df(
+            ws,
+            tbl,
+            index,
+            dtypes=dtypes,
+            errors=errors,
+            epoch=wb.epoch,
+            usecols=usecols,
+            skiprows=skiprows,
+            nrows=nrows,
+            stats=stats,
+        )
         for ws in wb.worksheets
         for name, tbl in {**ws.tables}.items()
     }
 
 
 def xlsx_table_to_df(
-    file, table: str, index: Union[Literal["auto"], int, Iterable[int]] = "auto"
+    file,
+    table: str,
+    index: Union[Literal["auto"], int, Iterable[int]] = "auto",
+    read_only: bool = False,
+    engine: Engine = "openpyxl",
+    dtypes: Optional[Mapping[str, Any]] = None,
+    errors: Errors = "raise",
+    usecols: Optional[Iterable[str]] = None,
+    skiprows: int = 0,
+    nrows: Optional[int] = None,
+    cache: Optional[Cache] = None,
+    stats: Optional[Stats] = None,
 ):
-    """Get a table from a given workbook by the tablename."""
+    """Get a table from a given workbook by the tablename.
 
-    # Load the workbook, from the filename, setting read_only to False
-    wb = load_workbook(
-        filename=file, read_only=False, keep_vba=False, data_only=True, keep_links=False
-    )
+    With `read_only=True` only the rows within the table range are streamed from the
+    worksheet, instead of loading the whole workbook. With `engine="xml"` the table
+    is decoded directly from the worksheet xml. See `xlsx_tables_to_dfs` for these
+    and for `dtypes`, `errors`, `usecols`, `skiprows`, `nrows`, `cache` and `stats`.
+    """
+    if cache is not None:
+        usecols = None if usecols is None else list(usecols)
+        key = cache.key(
+            file,
+            table,
+            *_cache_options(index, dtypes, errors, usecols, skiprows, nrows),
+        )
+        df = cache.get(key)
+        if df is None:
+            df = xlsx_table_to_df(
+                file,
+                table,
+                index,
+                read_only,
+                engine,
+                dtypes,
+                errors,
+                usecols,
+                skiprows,
+                nrows,
+                stats=stats,
+            )
+            cache.put(key, df)
+        return df
 
-    # Initialize the dictionary of tables
+    if read_only or engine != "openpyxl":
+        with XlsxTables(file, engine, stats) as tables:
+            return tables.read(table, index, dtypes, errors, usecols, skiprows, nrows)
+
+    # Load the workbook, from the filename
+    with timed(stats, None, "load") as counts:
+        wb = load_workbook(
+            filename=file,
+            read_only=False,
+            keep_vba=False,
+            data_only=True,
+            keep_links=False,
+        )
+        if isinstance(file, (str, os.PathLike)):
+            counts["bytes"] = os.path.getsize(file)
 
     for ws in wb.worksheets:
         if table in ws.tables:
-            return table_to_df(ws, ws.tables[table], index)
-    all_tables = {f"'{table}'" for ws in wb.worksheets for table in ws.tables.keys()}
-    raise TableNotFound(
-        f"Table '{table}' could not be found in the workbook. "
-        f"Choose from {', '.join(all_tables)}."
-    )
+            return table_to_df(
+                ws,
+                ws.tables[table],
+                index,
+                dtypes=dtypes,
+                errors=errors,
+                epoch=wb.epoch,
+                usecols=usecols,
+                skiprows=skiprows,
+                nrows=nrows,
+                stats=stats,
+            )
+    raise _table_not_found(table, (name for ws in wb.worksheets for name in ws.tables))
+
+
+def iter_xlsx_table(
+    file,
+    table: str,
+    chunksize: int = CHUNKSIZE,
+    index: Union[Literal["auto"], int, Iterable[int]] = "auto",
+    dtypes: Optional[Mapping[str, Any]] = None,
+    errors: Errors = "raise",
+    usecols: Optional[Iterable[str]] = None,
+    skiprows: int = 0,
+    nrows: Optional[int] = None,
+) -> Iterator[DataFrame]:
+    """Iterate a table from a given workbook in DataFrames of at most `chunksize`
+    rows.
+
+    The rows are streamed from the worksheet, so memory use is bounded by the
+    chunk size rather than the size of the table. The chunks have consistent
+    columns and a continuous range index (unless `index` sets one). The dtypes are
+    inferred from the first chunk and later chunks are converted to them. Integer
+    columns are inferred as floats, as later rows may hold empty cells or
+    fractions, pass an integer dtype in `dtypes` to keep them. A table without rows
+    yields a single empty DataFrame. The workbook is opened once the iteration
+    starts and closed when it ends or the iterator is closed. See
+    `xlsx_tables_to_dfs` for the other arguments.
+
+    >>> for chunk in iter_xlsx_table("my_file.xlsx", "Table1", chunksize=50_000):
+    ...     process(chunk)
+    """
+    with XlsxTables(file) as tables:
+        yield from tables.iter_table(
+            table, chunksize, index, dtypes, errors, usecols, skiprows, nrows
+        )
+
+
+def xlsx_tables_to_arrow(
+    file,
+    dtypes: Optional[Mapping[str, Any]] = None,
+    errors: Errors = "raise",
+) -> Dict[str, "pyarrow.Table"]:
+    """Get all tables from a given workbook as pyarrow tables, by table name.
+
+    Requires pyarrow. The tables are decoded with the xml engine and converted to
+    arrow column by column, without building DataFrames. See `xlsx_tables_to_dfs`
+    for `dtypes` and `errors`.
+    """
+    with XlsxTables(file, "xml") as tables:
+        return tables.read_arrow(None, dtypes, errors)
+
+
+def xlsx_table_to_arrow(
+    file,
+    table: str,
+    dtypes: Optional[Mapping[str, Any]] = None,
+    errors: Errors = "raise",
+) -> "pyarrow.Table":
+    """Get a table from a given workbook by the tablename, as a pyarrow table.
+
+    See `xlsx_tables_to_arrow`.
+    """
+    with XlsxTables(file, "xml") as tables:
+        return tables.read_arrow([table], dtypes, errors)[table]
@@ -0,0 +1,78 @@
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, NamedTuple, Optional
+
+import pandas as pd
+
+logger = logging.getLogger("pandas_xlsx_tables")
+
+
+class Phase(NamedTuple):
+    """Wall time and amount of work of a phase of reading or writing a table.
+
+    `table` is None for phases of the workbook as a whole, such as loading or
+    closing it.
+    """
+
+    table: Optional[str]
+    phase: str
+    seconds: float
+    rows: Optional[int] = None
+    cells: Optional[int] = None
+    bytes: Optional[int] = None
+
+
+class Stats:
+    """Collects the phases of the readers and writers it is passed to.
+
+    >>> stats = Stats()
+    >>> dfs_to_xlsx_tables([(df, "Table1")], "my_file.xlsx", stats=stats)
+    >>> stats.to_frame()
+        table    phase  seconds     rows      cells       bytes
+    0  Table1  formats    0.004      NaN        NaN         NaN
+    1  Table1   widths    0.001      NaN        NaN         NaN
+    2  Table1    cells    0.572  100000.0  200000.0         NaN
+    3  Table1    table    0.091      NaN        NaN         NaN
+    4    None    close    1.385      NaN        NaN   1122783.0
+    """
+
+    def __init__(self):
+        self.phases: List[Phase] = []
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.phases, columns=Phase._fields)
+
+    def seconds(self, phase: str) -> float:
+        """Total wall time of a phase, over all tables."""
+        return sum(p.seconds for p in self.phases if p.phase == phase)
+
+
+def timed(
+    stats: Optional[Stats], table: Optional[str], phase: str
+) -> ContextManager[Dict[str, int]]:
+    """Time a phase, which is recorded in `stats` and logged at DEBUG level.
+
+    The context gives a dict in which the `rows`, `cells` and `bytes` that were
+    processed can be set. Without stats and DEBUG logging nothing is timed.
+    """
+    if stats is None and not logger.isEnabledFor(logging.DEBUG):
+        return nullcontext({})
+    return _timed(stats, table, phase)
+
+
+@contextmanager
+def _timed(stats: Optional[Stats], table, phase) -> Iterator[Dict[str, int]]:
+    counts: Dict[str, int] = {}
+    start = time.perf_counter()
+    yield counts
+    record = Phase(table, phase, time.perf_counter() - start, **counts)
+    if stats is not None:
+        stats.phases.append(record)
+    logger.debug(
+        "%s%s: %.3fs%s",
+        "" if table is None else f"{table} ",
+        phase,
+        record.seconds,
+        "".join(f", {count} {name}" for name, count in counts.items()),
+    )
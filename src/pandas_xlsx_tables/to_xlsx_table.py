@@ -1,30 +1,715 @@
-from typing import BinaryIO, Iterable, Literal, Optional, Tuple, Union
+import os
+import threading
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import numpy as np
 import xlsxwriter
+import xlsxwriter.workbook
+import xlsxwriter.worksheet
 from openpyxl.worksheet.table import TableStyleInfo
-from pandas import DataFrame
+from pandas import DataFrame, Series
+from pandas.api.types import (
+    CategoricalDtype,
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+)
+from xlsxwriter.format import Format
 
-from .utils import NamedTableStyle, create_format_mapping, format_for_col
+from .stats import Stats, timed
+from .utils import (
+    FormatRegistry,
+    NamedTableStyle,
+    column_width,
+    create_format_mapping,
+    format_for_col,
+)
 
 HeaderOrientation = Literal["diagonal", "horizontal", "vertical"]
+ColumnFormat = Union[str, Mapping[str, Any]]
+Compression = Union[Literal["store", "fast", "max"], int]
+StringStorage = Literal["shared", "inline", "auto"]
 
 Inf = np.inf
+FLOAT_MAX = np.finfo(np.float64).max
+FLOAT_MIN = np.finfo(np.float64).min
+MICROSECONDS_PER_DAY = 24 * 60 * 60 * 1_000_000
+
+CHUNK_SIZE = 10_000
+COMPRESSION_LEVELS = {"fast": 1, "max": 9}
+# with "auto", strings are shared up to this many unique strings per string cell
+SHARED_STRINGS_MAX_RATIO = 0.5
+
+# zip options of the workbook that is being closed in the current thread
+_zip_local = threading.local()
+# workbooks with zip options that are being closed, in any thread
+_zip_lock = threading.Lock()
+_zip_closing = 0
+
+
+def _replace_nan_inf(df):
+    return df.replace(Inf, FLOAT_MAX).replace(-Inf, FLOAT_MIN).fillna("")
+
+
+def _zip_options(compression: Optional[Compression]) -> Optional[Dict[str, int]]:
+    if compression is None:
+        return None
+    if compression == "store":
+        return dict(compression=ZIP_STORED)
+    level = COMPRESSION_LEVELS.get(compression, compression)  # type: ignore
+    if type(level) is not int or not 0 <= level <= 9:
+        raise ValueError(
+            f"Invalid compression {compression!r}, expected 'store', 'fast', 'max' "
+            "or a deflate level from 0 to 9."
+        )
+    return dict(compression=ZIP_DEFLATED, compresslevel=level)
+
+
+def _zip_file(file, mode, compression=ZIP_DEFLATED, allowZip64=True) -> ZipFile:
+    options = getattr(_zip_local, "options", None) or dict(compression=compression)
+    return ZipFile(file, mode, allowZip64=allowZip64, **options)
+
+
+class _Workbook(xlsxwriter.Workbook):
+    """Workbook that writes its zip archive with the given compression, xlsxwriter
+    always deflates at the default level."""
+
+    def __init__(
+        self,
+        filename,
+        options,
+        compression: Optional[Compression],
+        strings: Union[StringStorage, Mapping[str, StringStorage], None] = None,
+    ):
+        self.zip_options = _zip_options(compression)
+        super().__init__(filename, options)
+        if strings is not None:
+            self.worksheet_class = _Worksheet
+
+    def _store_workbook(self) -> None:
+        global _zip_closing
+        if self.zip_options is None:
+            return super()._store_workbook()
+        # The zip file is created by name in xlsxwriter.workbook, which is pointed
+        # at _zip_file while any workbook with zip options is being closed. The
+        # options are per thread, other workbooks get the default compression.
+        with _zip_lock:
+            if not _zip_closing:
+                xlsxwriter.workbook.ZipFile = _zip_file  # type: ignore
+            _zip_closing += 1
+        _zip_local.options = self.zip_options
+        try:
+            super()._store_workbook()
+        finally:
+            _zip_local.options = None
+            with _zip_lock:
+                _zip_closing -= 1
+                if not _zip_closing:
+                    xlsxwriter.workbook.ZipFile = ZipFile  # type: ignore
+
+
+# xlsxwriter tells the type of a cell by the name of its tuple class, so the classes
+# keep the names xlsxwriter dispatches on. Its own string tuple is named differently
+# across versions.
+_InlineString = namedtuple("InlineString", "string, format")  # type: ignore[name-match]
+_SharedString = namedtuple("SharedString", "string, format")  # type: ignore[name-match]
+_String = namedtuple("String", "string, format")  # type: ignore[name-match]
+
+
+class _Worksheet(xlsxwriter.worksheet.Worksheet):
+    """Worksheet that stores the strings of some columns differently than the
+    workbook does: in the shared strings table, or inline in the cells.
+
+    xlsxwriter shares all strings, and writes them inline with constant_memory.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # column index -> whether its strings are inline
+        self.inline_strings: Dict[int, bool] = {}
+
+    def _write_string(self, row, col, string, cell_format=None):
+        inline = self.inline_strings.get(col)
+        if inline is None or inline == bool(self.constant_memory):
+            return super()._write_string(row, col, string, cell_format)
+        if self._check_dimensions(row, col):
+            return -1
+        str_error = 0
+        if len(string) > self.xls_strmax:
+            string, str_error = string[: self.xls_strmax], -2
+        if self.constant_memory and row > self.previous_row:
+            self._write_single_row(row)
+        if inline:
+            self.table[row][col] = _InlineString(string, cell_format)
+        else:
+            index = self.str_table._get_shared_string_index(string)
+            self.table[row][col] = _SharedString(index, cell_format)
+        return str_error
+
+    def _write_shared_index(self, row, col, index, cell_format=None):
+        """Write a string already in the shared strings table, a negative index
+        is an empty cell."""
+        if index < 0:
+            return self._write_blank(row, col, None, cell_format)
+        if self._check_dimensions(row, col):
+            return -1
+        if self.constant_memory and row > self.previous_row:
+            self._write_single_row(row)
+        self.table[row][col] = _SharedString(index, cell_format)
+        return 0
+
+    def _write_cell(self, row, col, cell):
+        cell_type = type(cell)
+        if cell_type is not _InlineString and cell_type is not _SharedString:
+            return super()._write_cell(row, col, cell)
+        # xlsxwriter writes the strings inline in constant_memory mode
+        constant_memory = self.constant_memory
+        self.constant_memory = cell_type is _InlineString
+        try:
+            super()._write_cell(row, col, _String(*cell))
+        finally:
+            self.constant_memory = constant_memory
+
+
+def _inline_strings(
+    column: Series,
+    name: str,
+    strings: Union[StringStorage, Mapping[str, StringStorage], None],
+) -> Optional[bool]:
+    """Whether to write the strings of a column inline, None to leave it to
+    xlsxwriter."""
+    storage = strings.get(name) if isinstance(strings, Mapping) else strings
+    if storage is None:
+        return None
+    if storage == "auto":
+        if isinstance(column.dtype, CategoricalDtype):
+            unique = len(column.cat.categories)
+        elif column.dtype == object:
+            unique = column.nunique()
+        else:
+            return None
+        return unique > SHARED_STRINGS_MAX_RATIO * column.count()
+    if storage not in ("shared", "inline"):
+        raise ValueError(
+            f"Invalid string storage {storage!r}, expected 'shared', 'inline' or "
+            "'auto'."
+        )
+    return storage == "inline"
+
+
+def _shared_string_indices(ws, chunk: Series) -> List[int]:
+    """Shared string index of every cell of a chunk of strings categories, looked
+    up once per category. Missing values are -1."""
+    categories = chunk.cat.categories
+    table = ws.str_table
+    indices = [table._get_shared_string_index(c[: ws.xls_strmax]) for c in categories]
+    codes = chunk.cat.codes.to_numpy()
+    # the table counts the references to its strings
+    table.count += int(np.count_nonzero(codes >= 0)) - len(categories)
+    return np.array(indices + [-1])[codes].tolist()
+
+
+class _DiscardCells(dict):
+    def __setitem__(self, key, value):
+        pass
+
+
+def _add_table(ws, first_row, first_col, last_row, last_col, options) -> None:
+    """Register a table over rows that have already been written.
+
+    The header and the rows are streamed before the table is added, once the
+    number of rows is known. add_table writes the header cells again, these go
+    into a scratch table that is thrown away, and their strings are taken out of
+    the shared strings table again. xlsxwriter refuses tables in constant_memory
+    mode because of these out of order writes, so the mode is switched off
+    meanwhile.
+    """
+    # Recent xlsxwriter versions also keep every cell of the table for overlap
+    # checks, which grows with the number of rows. The worksheet only holds this
+    # table, so these are discarded.
+    cells, table_cells, constant_memory = (
+        ws.table,
+        getattr(ws, "table_cells", None),
+        ws.constant_memory,
+    )
+    strings = ws.str_table
+    count, unique_count = strings.count, strings.unique_count
+    ws.table = defaultdict(dict)
+    ws.table_cells = _DiscardCells()
+    ws.constant_memory = False
+    try:
+        ws.add_table(first_row, first_col, last_row, last_col, options)
+    finally:
+        ws.table, ws.table_cells, ws.constant_memory = (
+            cells,
+            table_cells,
+            constant_memory,
+        )
+        # new strings are added last
+        added = strings.unique_count - unique_count
+        for string in list(islice(reversed(strings.string_table), added)):
+            del strings.string_table[string]
+        strings.count, strings.unique_count = count, unique_count
+
+
+def _iter_chunks(data) -> Tuple[Iterator[DataFrame], bool]:
+    """DataFrame chunks of a DataFrame, an iterable of DataFrames, or of arrow data,
+    and whether the chunks are arrow data.
+
+    Arrow tables, record batches and record batch readers, and anything with a
+    `to_arrow` method such as a polars DataFrame, are converted to pandas one
+    record batch at a time.
+    """
+    if isinstance(data, DataFrame):
+        return iter((data,)), False
+    if hasattr(data, "to_arrow"):
+        data = data.to_arrow()
+    if hasattr(data, "to_batches"):
+        data = data.to_batches(max_chunksize=CHUNK_SIZE)
+    elif hasattr(data, "to_pandas"):
+        data = (data,)
+    chunks = iter(data)
+    first = next(chunks, None)
+    if first is None:
+        return iter(()), False
+    return (
+        chunk.to_pandas() if hasattr(chunk, "to_pandas") else chunk
+        for chunk in chain([first], chunks)
+    ), hasattr(first, "to_pandas")
+
+
+def _is_frame(data) -> bool:
+    """Whether data is a single frame rather than an iterable of chunks."""
+    return isinstance(data, DataFrame) or any(
+        hasattr(data, method) for method in ("to_arrow", "to_batches", "to_pandas")
+    )
+
+
+def _columns(df: DataFrame, index: bool) -> Tuple[List[Hashable], List[Series]]:
+    """Labels and columns of df, preceded by the index levels if index is True.
+
+    Equivalent to the columns of df.reset_index(), without copying the frame.
+    """
+    columns = [df.iloc[:, i] for i in range(len(df.columns))]
+    if not index:
+        return list(df.columns), columns
+    levels = [
+        Series(df.index.get_level_values(i).array, copy=False)
+        for i in range(df.index.nlevels)
+    ]
+    return list(df.iloc[:0].reset_index().columns), levels + columns
+
+
+def _column_format(column: Series, format_mapping, nan_inf_to_errors, sample_size):
+    if not nan_inf_to_errors and is_float_dtype(column.dtype):
+        if column.hasnans:
+            # NaN is written as an empty string, which makes the column text
+            return format_mapping["text"]
+        if np.isinf(column.to_numpy(dtype=float)).any():
+            # Inf is written as the largest float, which needs scientific notation
+            return format_mapping["scientific"]
+    return format_for_col(column, format_mapping, sample_size)
+
+
+def _excel_serials(ws, chunk: Series) -> np.ndarray:
+    """Excel serial dates of a datetime64 chunk, computed like xlsxwriter does."""
+    if chunk.dt.tz is not None:
+        if not ws.remove_timezone:
+            raise TypeError(
+                "Excel doesn't support timezones in datetimes. "
+                "Set the tzinfo in the datetime/time object to None or "
+                "use the 'remove_timezone' Workbook() option"
+            )
+        chunk = chunk.dt.tz_localize(None)
+    epoch = np.datetime64("1904-01-01" if ws.date_1904 else "1899-12-31", "us")
+    delta = chunk.to_numpy("datetime64[us]") - epoch
+    days, microseconds = np.divmod(delta.view(np.int64), MICROSECONDS_PER_DAY)
+    seconds, microseconds = np.divmod(microseconds, 1_000_000)
+    serials = days + (seconds + microseconds / 1e6) / (60 * 60 * 24)
+    if not ws.date_1904:
+        # A time on 1900-01-01 is stored as 1899-12-31 + time, and Excel treats
+        # 1900 as a leap year.
+        serials[days == 1] -= 1
+        serials[serials > 59] += 1
+    return serials
+
+
+def _chunk_cells(
+    ws,
+    column: Series,
+    start: int,
+    stop: int,
+    nan_inf_to_errors,
+    inline: Optional[bool] = None,
+):
+    """Writer and cell values for rows start:stop of a column.
+
+    The writer is chosen from the dtype, so xlsxwriter does not have to sniff the
+    type of every cell. Unless written as errors, NaN becomes an empty cell and
+    +/-Inf the largest double precision float. Chunks with empty cells and columns
+    without a native type fall back to the generic `write`. Categories of strings
+    that are shared are written by their index in the shared strings table.
+    """
+    chunk = column.iloc[start:stop]
+    dtype = chunk.dtype
+    if isinstance(dtype, CategoricalDtype):
+        if inline is False and dtype.categories.inferred_type == "string":
+            return ws._write_shared_index, _shared_string_indices(ws, chunk)
+        chunk = chunk.astype(object)
+        dtype = chunk.dtype
+    if is_bool_dtype(dtype) and isinstance(dtype, np.dtype):
+        return ws._write_boolean, chunk.tolist()
+    if is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        return ws._write_number, chunk.tolist()
+    if is_float_dtype(dtype) and isinstance(dtype, np.dtype):
+        values = chunk.to_numpy()
+        if nan_inf_to_errors:
+            return ws._write_number, values.tolist()
+        cells = np.clip(values, FLOAT_MIN, FLOAT_MAX).tolist()
+        empty = np.flatnonzero(np.isnan(values))
+        if not len(empty):
+            return ws._write_number, cells
+        for i in empty:
+            cells[i] = ""
+        return ws._write, cells
+    if is_datetime64_any_dtype(dtype):
+        cells = _excel_serials(ws, chunk).tolist()
+        empty = np.flatnonzero(chunk.isna().to_numpy())
+        if not len(empty):
+            return ws._write_number, cells
+        for i in empty:
+            cells[i] = ""
+        return ws._write, cells
+    if nan_inf_to_errors:
+        return ws._write, chunk.tolist()
+    return ws._write, _replace_nan_inf(chunk).tolist()
+
+
+def _write_rows(
+    ws, columns, formats, nan_inf_to_errors, first_row=1, chunk_size=CHUNK_SIZE
+) -> None:
+    """Write the columns from first_row on in row order, a chunk at a time."""
+    nrows = len(columns[0]) if columns else 0
+    inline = getattr(ws, "inline_strings", {})
+    for start in range(0, nrows, chunk_size):
+        stop = min(start + chunk_size, nrows)
+        writers, chunk = zip(
+            *(
+                _chunk_cells(ws, c, start, stop, nan_inf_to_errors, inline.get(i))
+                for i, c in enumerate(columns)
+            )
+        )
+        cells = tuple(zip(range(len(columns)), writers, formats))
+        for row, values in enumerate(zip(*chunk), start=first_row + start):
+            for (col, write, cell_format), value in zip(cells, values):
+                write(row, col, value, cell_format)
+
+
+HEADER_ROTATIONS = {"diagonal": 45, "vertical": 90}
+
+
+def _workbook_formats(
+    wb, header_orientation: HeaderOrientation, column_formats: Mapping
+) -> Tuple[FormatRegistry, dict, Optional[Format]]:
+    """Create the formats of a workbook, always in the same order."""
+    formats = FormatRegistry(wb)
+    format_mapping = create_format_mapping(formats)
+    header_format = None
+    if header_orientation in HEADER_ROTATIONS:
+        header_format = formats.add_format(
+            {"rotation": HEADER_ROTATIONS[header_orientation]}
+        )
+    for properties in column_formats.values():
+        formats.add_format(properties)
+    return formats, format_mapping, header_format
+
+
+def _write_table(
+    ws,
+    data,
+    table_name: str,
+    formats: FormatRegistry,
+    format_mapping: dict,
+    header_format: Optional[Format],
+    stats: Optional[Stats],
+    index: bool,
+    header_orientation: HeaderOrientation,
+    column_formats: Mapping[str, ColumnFormat],
+    nan_inf_to_errors: bool,
+    format_sample_size: Optional[int],
+    strings: Union[StringStorage, Mapping[str, StringStorage], None] = None,
+) -> Tuple[List[str], List[Optional[Format]], Optional[List[float]], int, bool]:
+    """Write the header and the rows of a table to an empty worksheet.
+
+    Returns the column names, the format of every column, the column widths (for
+    horizontal headers), the number of rows and whether the index was written.
+    Arrow data has no index, the index of its pandas chunks is ignored.
+    """
+    chunks, arrow = _iter_chunks(data)
+    df = next(chunks, None)
+    if df is None:
+        raise ValueError(f"No data for table '{table_name}'.")
+    index = index and not arrow
+    labels, columns = _columns(df, index)
+
+    column_names = [str(c) for c in labels]
+    with timed(stats, table_name, "formats"):
+        cell_formats = [
+            (
+                formats.add_format(column_formats[col_name])
+                if col_name in column_formats
+                else _column_format(
+                    column, format_mapping, nan_inf_to_errors, format_sample_size
+                )
+            )
+            for column, col_name in zip(columns, column_names)
+        ]
+    for i, col_name in enumerate(column_names):
+        ws.write_string(0, i, col_name)
+    if strings is not None:
+        # decided from the first chunk, like the formats
+        with timed(stats, table_name, "strings"):
+            for i, (column, col_name) in enumerate(zip(columns, column_names)):
+                inline = _inline_strings(column, col_name, strings)
+                if inline is not None:
+                    ws.inline_strings[i] = inline
+
+    widths = None
+    if header_orientation == "diagonal":
+        ws.set_row(
+            0, max(15, 12 + 4 * max(len(c) for c in column_names)), header_format
+        )
+    elif header_orientation == "vertical":
+        ws.set_row(0, max(15, 4 + 6 * max(len(c) for c in column_names)), header_format)
+    elif header_orientation == "horizontal":
+        # fit the column widths to the header and a sample of the values
+        with timed(stats, table_name, "widths"):
+            widths = [
+                max(8.43, len(col_name), column_width(column))
+                for column, col_name in zip(columns, column_names)
+            ]
+
+    nrows = 0
+    with timed(stats, table_name, "cells") as counts:
+        for i, chunk in enumerate(chain([df], chunks)):
+            chunk_columns = columns if i == 0 else _columns(chunk, index)[1]
+            if len(chunk_columns) != len(cell_formats):
+                raise ValueError(
+                    f"All chunks of table '{table_name}' should have the same columns."
+                )
+            _write_rows(
+                ws, chunk_columns, cell_formats, nan_inf_to_errors, first_row=1 + nrows
+            )
+            nrows += len(chunk)
+        counts.update(rows=nrows, cells=nrows * len(cell_formats))
+    return column_names, cell_formats, widths, nrows, index
+
+
+def _finish_table(
+    ws,
+    table_name: str,
+    table_style,
+    index: bool,
+    column_names: List[str],
+    cell_formats: List[Optional[Format]],
+    widths: Optional[List[float]],
+    nrows: int,
+    stats: Optional[Stats],
+) -> None:
+    """Set the column widths and add the table over the written rows."""
+    for i, width in enumerate(widths or ()):
+        ws.set_column(i, i, width)
+    options = {
+        "name": table_name,
+        "style": table_style,
+        "first_column": index,
+        "columns": [
+            {"header": col_name, "format": cell_format}
+            for col_name, cell_format in zip(column_names, cell_formats)
+        ],
+    }
+    with timed(stats, table_name, "table"):
+        _add_table(ws, 0, 0, nrows, len(column_names) - 1, options)
+
+
+def _write_tables_parallel(
+    wb, input: list, formats: FormatRegistry, workers: int, table_style, settings, stats
+) -> None:
+    """Write the rows of every table in a pool of `workers` processes.
+
+    A worker writes the rows of a table to a worksheet of its own constant_memory
+    workbook, which flushes the xml of the rows to a temporary file as it goes, with
+    strings inline. The formats are created in the same order in every workbook and
+    numbered up front, so the cells refer to the same styles in all of them. The
+    files become the sheet data of the worksheets of `wb`, which adds the tables
+    and the workbook parts when it is closed.
+    """
+    for fmt in formats:
+        fmt._get_xf_index()
+    by_index: Dict[int, Format] = {}
+    for fmt in formats:
+        by_index.setdefault(fmt._get_xf_index(), fmt)
+
+    sheets = [wb.add_worksheet(name=table_name) for _, table_name in input]
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(
+                _write_table_rows,
+                # iterators of chunks can not be sent to a process, frames can
+                data if _is_frame(data) else list(data),
+                table_name,
+                {**settings, "remove_timezone": wb.remove_timezone},
+                stats is not None,
+            )
+            for data, table_name in input
+        ]
+        try:
+            for ws, (_, table_name), future in zip(sheets, input, futures):
+                (
+                    filename,
+                    column_names,
+                    indices,
+                    widths,
+                    nrows,
+                    index,
+                    phases,
+                ) = future.result()
+                _use_rows(ws, filename, nrows, len(column_names))
+                if stats is not None:
+                    stats.phases.extend(phases)
+                _finish_table(
+                    ws,
+                    table_name,
+                    table_style,
+                    index,
+                    column_names,
+                    [by_index.get(i) for i in indices],
+                    widths,
+                    nrows,
+                    stats,
+                )
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    _remove(future.result()[0])
+            for ws in sheets:
+                ws.row_data_fh.close()
+                _remove(ws.row_data_filename)
+            raise
+
+
+def _write_table_rows(data, table_name: str, settings, collect_stats: bool) -> tuple:
+    """Write the header and rows of a table in a worker process, see
+    `_write_tables_parallel`."""
+    settings = dict(settings)
+    wb = xlsxwriter.Workbook(
+        None,
+        options=dict(
+            nan_inf_to_errors=settings["nan_inf_to_errors"],
+            remove_timezone=settings.pop("remove_timezone"),
+            constant_memory=True,
+        ),
+    )
+    formats, format_mapping, header_format = _workbook_formats(
+        wb, settings["header_orientation"], settings["column_formats"]
+    )
+    for fmt in formats:
+        fmt._get_xf_index()
+    stats = Stats() if collect_stats else None
+    ws = wb.add_worksheet(name=table_name)
+    try:
+        column_names, cell_formats, widths, nrows, index = _write_table(
+            ws,
+            data,
+            table_name,
+            formats,
+            format_mapping,
+            header_format,
+            stats,
+            **settings,
+        )
+        ws._write_single_row()  # flush the last row
+    except BaseException:
+        ws.row_data_fh.close()
+        _remove(ws.row_data_filename)
+        raise
+    ws.row_data_fh.close()
+    indices = [None if f is None else f._get_xf_index() for f in cell_formats]
+    phases = stats.phases if stats is not None else []
+    return ws.row_data_filename, column_names, indices, widths, nrows, index, phases
+
+
+def _use_rows(ws, filename: str, nrows: int, ncols: int) -> None:
+    """Use the rows in `filename` as the sheet data of a constant_memory sheet."""
+    ws.row_data_fh.close()
+    _remove(ws.row_data_filename)
+    ws.row_data_filename = filename
+    ws.row_data_fh = ws.fh = open(filename, mode="a+", encoding="utf-8")
+    ws.dim_rowmin, ws.dim_rowmax = 0, nrows
+    ws.dim_colmin, ws.dim_colmax = 0, ncols - 1
+
+
+def _remove(filename: str) -> None:
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
 
 
 def dfs_to_xlsx_tables(
-    input: Iterable[Tuple[DataFrame, str]],
+    input: Iterable[Tuple[Union[DataFrame, Iterable[DataFrame], Any], str]],
     file: Union[str, BinaryIO],
     index: bool = True,
     table_style: Optional[NamedTableStyle] = "Table Style Medium 9",
     nan_inf_to_errors=False,
     header_orientation: HeaderOrientation = "horizontal",
     remove_timezone: bool = False,
+    constant_memory: bool = False,
+    format_sample_size: Optional[int] = None,
+    column_formats: Optional[Mapping[str, ColumnFormat]] = None,
+    stats: Optional[Stats] = None,
+    workers: Optional[int] = None,
+    compression: Optional[Compression] = None,
+    strings: Union[StringStorage, Mapping[str, StringStorage], None] = None,
 ) -> None:
     """Convert multiple dataframes to an excel file.
 
+    Instead of a DataFrame, a table can be given as an iterable of DataFrame chunks
+    with the same columns, such as `pd.read_csv(..., chunksize=...)`. The chunks are
+    appended to the table in order and the column formats are determined from the
+    first chunk, so the table never needs to fit in memory as a whole. Arrow tables,
+    record batches and record batch readers, or polars DataFrames, are converted to
+    pandas one record batch at a time. They have no index,
+    so `index` is ignored for them.
+
+    Rows are written in order, a chunk at a time, so no object copy of the whole
+    frame is made. With `constant_memory` xlsxwriter also flushes every row to disk
+    once it is written, keeping peak memory flat as the number of rows grows.
+
     Args:
-        input (Iterable[Tuple[DataFrame, str]]): A list of tuples of (df, table_name)
+        input (Iterable[Tuple[Union[DataFrame, Iterable[DataFrame], Any], str]]): A
+            list of tuples of (df, table_name), of (chunks, table_name) or of
+            (arrow_table, table_name)
         file (Union[str, BinaryIO]): File name or descriptor for the output
         index (bool, optional): Include the datafrme index in the results.
              Defaults to True
@@ -35,60 +720,105 @@ def dfs_to_xlsx_tables(
         header_orientation (HeaderOrientation, optional): Rotate the table headers,
             can be horizontal, vertical or diagonal.
             Defaults to "horizontal".
+        remove_timezone (bool, optional): Remove the timezone from datetimes.
+            Defaults to False.
+        constant_memory (bool, optional): Flush each row to a temporary file once
+            written, see the xlsxwriter documentation. Defaults to False.
+        format_sample_size (Optional[int], optional): Choose the number format of
+            float columns from this many evenly spaced values, instead of from all
+            values. Defaults to None.
+        column_formats (Optional[Mapping[str, ColumnFormat]], optional): Format for
+            columns by name, in any table, instead of the automatic number format.
+            Either a number format such as "#,##0.00" or xlsxwriter format
+            properties. Equal formats are created only once per workbook.
+            Defaults to None.
+        stats (Optional[Stats], optional): Record the wall time of each phase
+            of writing every table, and of closing the workbook, which compresses
+            it. The phases are also logged at DEBUG level. Defaults to None.
+        workers (Optional[int], optional): Write the rows of the tables in a pool
+            of this many processes, if larger than one. Each table is written by
+            one worker, with strings inline instead of in a shared strings part.
+            The data is sent to the workers, so iterables of chunks are collected
+            first. Defaults to None.
+        compression (Optional[Compression], optional): Compression of the zip
+            archive: "store" to not compress at all, "fast" or "max" for the
+            lowest or highest deflate level, or a deflate level from 0 to 9.
+            Storing saves the time of deflating, but gives files several times
+            larger, while "max" takes much longer for files hardly smaller than the
+            default. See benchmarks/compression.py. Defaults to None, the default
+            deflate level of xlsxwriter.
+        strings (Union[StringStorage, Mapping[str, StringStorage], None], optional):
+            Store strings in the shared strings table of the workbook, which keeps
+            every unique string in memory until the workbook is closed, or inline
+            in their cells. Either for all columns, or for columns by name, in any
+            table. With "auto", strings are shared if a column has at most half as
+            many unique strings as cells, which is free to tell for categoricals,
+            whose categories are then looked up once instead of per cell. The
+            choice is made from the first chunk of a table. Ignored with
+            `workers`. Defaults to None: shared, or inline with `constant_memory`.
     """
-    wb = xlsxwriter.Workbook(
+    column_formats = column_formats or {}
+    # tables are only collected up front for a pool, otherwise they are written as
+    # they come
+    tables = list(input) if workers is not None and workers > 1 else []
+    processes = min(workers or 1, len(tables))
+    parallel = processes > 1
+    wb = _Workbook(
         file,
         options=dict(
             nan_inf_to_errors=nan_inf_to_errors,
             remove_timezone=remove_timezone,
+            # the rows written by workers are sheet data of constant_memory sheets
+            constant_memory=constant_memory or parallel,
         ),
+        compression=compression,
+        strings=None if parallel else strings,
     )
 
-    format_mapping = create_format_mapping(wb)
-    if header_orientation == "diagonal":
-        header_format = wb.add_format()
-        header_format.set_rotation(45)
-    elif header_orientation == "vertical":
-        header_format = wb.add_format()
-        header_format.set_rotation(90)
-
-    for df, table_name in input:
-        ws = wb.add_worksheet(name=table_name)
-        if index:
-            df = df.reset_index()
-        if not nan_inf_to_errors:
-            df = (
-                df.replace(Inf, np.finfo(np.float64).max)
-                .replace(-Inf, np.finfo(np.float64).min)
-                .fillna("")
-            )
+    formats, format_mapping, header_format = _workbook_formats(
+        wb, header_orientation, column_formats
+    )
+    settings = dict(
+        index=index,
+        header_orientation=header_orientation,
+        column_formats=column_formats,
+        nan_inf_to_errors=nan_inf_to_errors,
+        format_sample_size=format_sample_size,
+    )
 
-        column_names = (str(c) for c in df.columns)
-        options = {
-            "data": df.values,
-            "name": table_name,
-            "style": table_style,
-            "first_column": index,
-            "columns": [
-                {"header": col_name, "format": format_for_col(df[col], format_mapping)}
-                for col, col_name in zip(df.columns, column_names)
-            ],
-        }
-        ws.add_table(0, 0, len(df), len(df.columns) - 1, options)
-
-        if header_orientation == "diagonal":
-            ws.set_row(
-                0, max(15, 12 + 4 * max(len(c) for c in column_names)), header_format
+    if parallel:
+        _write_tables_parallel(
+            wb, tables, formats, processes, table_style, settings, stats
+        )
+    else:
+        for data, table_name in tables or input:
+            ws = wb.add_worksheet(name=table_name)
+            column_names, cell_formats, widths, nrows, table_index = _write_table(
+                ws,
+                data,
+                table_name,
+                formats,
+                format_mapping,
+                header_format,
+                stats,
+                strings=strings,
+                **settings,
             )
-        elif header_orientation == "vertical":
-            ws.set_row(
-                0, max(15, 4 + 6 * max(len(c) for c in column_names)), header_format
+            _finish_table(
+                ws,
+                table_name,
+                table_style,
+                table_index,
+                column_names,
+                cell_formats,
+                widths,
+                nrows,
+                stats,
             )
-        elif header_orientation == "horizontal":
-            # adjust row widths
-            for i, width in enumerate(len(str(x)) for x in column_names):
-                ws.set_column(i, i, max(8.43, width))
-    wb.close()
+    with timed(stats, None, "close") as counts:
+        wb.close()
+        if isinstance(file, (str, os.PathLike)):
+            counts["bytes"] = os.path.getsize(file)
     return
 
 
@@ -101,6 +831,12 @@ def df_to_xlsx_table(
     nan_inf_to_errors=False,
     header_orientation: HeaderOrientation = "horizontal",
     remove_timezone: bool = False,
+    constant_memory: bool = False,
+    format_sample_size: Optional[int] = None,
+    column_formats: Optional[Mapping[str, ColumnFormat]] = None,
+    stats: Optional[Stats] = None,
+    compression: Optional[Compression] = None,
+    strings: Union[StringStorage, Mapping[str, StringStorage], None] = None,
 ) -> None:
     """Convert single dataframe to an excel file.
 
@@ -117,6 +853,22 @@ def df_to_xlsx_table(
             Defaults to False.
         header_orientation (HeaderOrientation, optional): Rotate the table headers, can
             be horizontal, vertical or diagonal. Defaults to "horizontal".
+        remove_timezone (bool, optional): Remove the timezone from datetimes.
+            Defaults to False.
+        constant_memory (bool, optional): Flush each row to a temporary file once
+            written. Defaults to False.
+        format_sample_size (Optional[int], optional): Choose the number format of
+            float columns from this many values. Defaults to None.
+        column_formats (Optional[Mapping[str, ColumnFormat]], optional): Number
+            format or xlsxwriter format properties for columns by name. Defaults to
+            None.
+        stats (Optional[Stats], optional): Record the wall time of each phase.
+            Defaults to None.
+        compression (Optional[Compression], optional): "store", "fast", "max" or
+            a deflate level from 0 to 9. Defaults to None.
+        strings (Union[StringStorage, Mapping[str, StringStorage], None], optional):
+            Store strings "shared", "inline" or choose per column with "auto", for
+            all columns or for columns by name. Defaults to None.
     """
     dfs_to_xlsx_tables(
         [(df, table_name)],
@@ -126,4 +878,10 @@ def df_to_xlsx_table(
         nan_inf_to_errors=nan_inf_to_errors,
         header_orientation=header_orientation,
         remove_timezone=remove_timezone,
+        constant_memory=constant_memory,
+        format_sample_size=format_sample_size,
+        column_formats=column_formats,
+        stats=stats,
+        compression=compression,
+        strings=strings,
     )
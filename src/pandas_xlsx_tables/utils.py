@@ -1,13 +1,39 @@
-from typing import Dict, Literal
+import math
+from typing import Any, Dict, Iterator, Literal, Mapping, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import (
+    is_bool_dtype,
     is_datetime64_any_dtype,
     is_float_dtype,
     is_integer_dtype,
+    is_numeric_dtype,
     is_string_dtype,
 )
-from pandas.io.formats.format import FloatArrayFormatter
+from xlsxwriter.format import Format
+from xlsxwriter.workbook import Workbook
+
+# Decimals used by pandas to format a float array
+FLOAT_PRECISION = 7
+
+NANOSECONDS_PER_DAY = 24 * 60 * 60 * 10**9
+DATETIME_UNITS = (
+    ("date", NANOSECONDS_PER_DAY),
+    ("datetime-minutes", 60 * 10**9),
+    ("datetime-seconds", 10**9),
+)
+
+# Width of the datetime formats, in characters
+DATETIME_WIDTHS = {
+    "date": 10,
+    "datetime-minutes": 16,
+    "datetime-seconds": 19,
+    "datetime-milliseconds": 23,
+}
+# Values used to estimate the width of a column, and the widest column
+WIDTH_SAMPLE_SIZE = 1000
+MAX_COLUMN_WIDTH = 50
 
 NamedTableStyle = Literal[
     "Table Style Dark 1",
@@ -73,6 +99,39 @@ NamedTableStyle = Literal[
 ]
 
 
+class FormatRegistry:
+    """Cache of the formats of a workbook, keyed on their properties.
+
+    A format is only added to the workbook the first time a set of properties is
+    requested, after which the same format is returned, for any table. It has the
+    `add_format` method of a workbook, so it can be used in its place. A number
+    format can also be given as a string.
+
+    >>> formats = FormatRegistry(workbook)
+    >>> formats.add_format("#,##0.00") is formats.add_format({"num_format": "#,##0.00"})
+    True
+    """
+
+    def __init__(self, workbook: Workbook):
+        self.workbook = workbook
+        self._formats: Dict[Tuple, Format] = {}
+
+    def add_format(self, properties: Union[str, Mapping[str, Any], None] = None):
+        if isinstance(properties, str):
+            properties = {"num_format": properties}
+        key = tuple(sorted((properties or {}).items()))
+        if key not in self._formats:
+            self._formats[key] = self.workbook.add_format(dict(key))
+        return self._formats[key]
+
+    def __len__(self) -> int:
+        return len(self._formats)
+
+    def __iter__(self) -> Iterator[Format]:
+        """The formats, in the order they were added."""
+        return iter(self._formats.values())
+
+
 def create_format_mapping(workbook):
     return {
         "text": workbook.add_format({"num_format": "@"}),
@@ -91,20 +150,76 @@ def create_format_mapping(workbook):
     }
 
 
-def format_for_col(col: pd.Series, format_mapping: Dict):
+def float_digits(
+    values: np.ndarray, sample_size: Optional[int] = None
+) -> Optional[int]:
+    """Number of decimals needed to show the float values, or None when they need
+    scientific notation.
+
+    Follows the way pandas formats a float array: the values are rounded to 7
+    decimals and the trailing zeros they all have in common are dropped, keeping at
+    least one decimal. Scientific notation is used when a value is non-zero but
+    smaller than 1e-7, or when a value is larger than 1e6 and the widest value would
+    take more than 11 digits.
+
+    All values are checked unless `sample_size` is given, then only that many values
+    at evenly spaced positions are.
+    """
+    if sample_size is not None and len(values) > sample_size:
+        values = values[:: -(-len(values) // sample_size)]
+    values = np.abs(values[~np.isnan(values)])
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        return 1 if not len(values) else None
+    if ((finite < 10.0**-FLOAT_PRECISION) & (finite > 0)).any():
+        return None
+
+    # Only the fractions, to stay within the exact integer range of a float
+    scaled = np.rint((finite - np.floor(finite)) * 10**FLOAT_PRECISION)
+    # The common trailing zeros are those of the greatest common divisor
+    divisor = math.gcd(int(np.gcd.reduce(scaled.astype(np.int64))), 10**FLOAT_PRECISION)
+    digits = FLOAT_PRECISION
+    while digits > 1 and divisor % 10 == 0:
+        divisor //= 10
+        digits -= 1
+
+    largest = values.max()
+    if largest > 1e6:
+        integer_digits = int(np.log10(finite.max())) + 1
+        if integer_digits + digits > 11:
+            return None
+    return digits
+
+
+def datetime_resolution(col: pd.Series) -> str:
+    """Key of the datetime format for the coarsest unit that fits all values.
+
+    A single greatest common divisor pass over the nanoseconds since the epoch gives
+    the smallest time unit in use. Timezone aware columns are checked on wall time
+    and NaT is ignored.
+    """
+    if col.dt.tz is not None:
+        col = col.dt.tz_localize(None)
+    nanoseconds = col.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    nanoseconds = nanoseconds[nanoseconds != np.iinfo(np.int64).min]
+    divisor = math.gcd(int(np.gcd.reduce(nanoseconds)), NANOSECONDS_PER_DAY)
+    for key, unit in DATETIME_UNITS:
+        if divisor % unit == 0:
+            return key
+    return "datetime-milliseconds"
+
+
+def format_for_col(
+    col: pd.Series, format_mapping: Dict, sample_size: Optional[int] = None
+):
     # https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases
     if is_integer_dtype(col):
         return format_mapping["int"]
 
     elif is_float_dtype(col):
-        # use pandas internal function to determine float format (number of
-        # digits or scientific notation)
-        suffix = (
-            FloatArrayFormatter(col[~col.isna()]).get_result_as_array()[0].split(".")[1]
-        )
-        if "e" in suffix:
+        digits = float_digits(col.to_numpy(dtype=float, na_value=np.nan), sample_size)
+        if digits is None:
             return format_mapping["scientific"]
-        digits = len(suffix)
         if digits <= 1:
             return format_mapping["float1"]
         elif digits <= 2:
@@ -117,12 +232,34 @@ def format_for_col(col: pd.Series, format_mapping: Dict):
     elif is_string_dtype(col):
         return format_mapping["text"]
     elif is_datetime64_any_dtype(col):
-        # check smallest used time unit for precision
-        if all((col - col.dt.floor("1D")) == pd.Timedelta(0)):
-            return format_mapping["date"]
-        elif all((col - col.dt.floor("min")) == pd.Timedelta(0)):
-            return format_mapping["datetime-minutes"]
-        elif all((col - col.dt.floor("S")) == pd.Timedelta(0)):
-            return format_mapping["datetime-seconds"]
-        else:
-            return format_mapping["datetime-milliseconds"]
+        return format_mapping[datetime_resolution(col)]
+
+
+def column_width(col: pd.Series, sample_size: int = WIDTH_SAMPLE_SIZE) -> float:
+    """Estimated width in characters of the widest value of a column.
+
+    Only `sample_size` evenly spaced values are inspected, the width of numbers is
+    derived from their magnitude and that of datetimes from their format, so only
+    strings are converted. The width is capped at `MAX_COLUMN_WIDTH`.
+    """
+    if len(col) > sample_size:
+        col = col.iloc[:: -(-len(col) // sample_size)]
+    col = col.dropna()
+    if not len(col):
+        return 0
+    if is_bool_dtype(col):
+        width = 5
+    elif is_datetime64_any_dtype(col):
+        width = DATETIME_WIDTHS[datetime_resolution(col)]
+    elif is_numeric_dtype(col):
+        values = col.to_numpy(dtype=float)
+        largest = np.abs(values[np.isfinite(values)]).max(initial=0)
+        integer_digits = int(np.log10(largest)) + 1 if largest >= 1 else 1
+        width = integer_digits + bool((values < 0).any())
+        if is_float_dtype(col):
+            # the float formats show 1, 2, 3 or 6 decimals, or scientific notation
+            digits = float_digits(values)
+            width = 9 if digits is None else width + 1 + (digits if digits <= 3 else 6)
+    else:
+        width = col.astype(str).str.len().max()
+    return min(width, MAX_COLUMN_WIDTH)
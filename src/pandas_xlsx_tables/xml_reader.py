@@ -0,0 +1,618 @@
+"""Decode tables straight from the worksheet xml, without creating openpyxl cells.
+
+The worksheet is read incrementally and only the cells within the requested table
+ranges are collected, per column. Each column is then converted to a single NumPy
+array in one go.
+"""
+
+import re
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from html import unescape
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+from zipfile import ZipFile
+
+import numpy as np
+from openpyxl.packaging.manifest import Manifest
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.reader.excel import _find_workbook_part
+from openpyxl.reader.strings import read_string_table
+from openpyxl.reader.workbook import WorkbookParser
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.utils.cell import get_column_letter, range_boundaries
+from openpyxl.utils.datetime import WINDOWS_EPOCH, from_excel, from_ISO8601
+from openpyxl.worksheet.table import Table
+from openpyxl.xml.constants import (
+    ARC_CONTENT_TYPES,
+    ARC_STYLE,
+    SHARED_STRINGS,
+)
+from openpyxl.xml.functions import fromstring
+from pandas.api.types import pandas_dtype
+
+ROOT = re.compile(rb"<([\w.-]+:)?worksheet[\s/>]")
+ROW_NUMBER = re.compile(rb"\sr\s*=\s*[\"'](\d+)")
+CELL_COLUMN = re.compile(rb"\sr\s*=\s*[\"']([A-Z]+)")
+CELL_TYPE = re.compile(rb"\st\s*=\s*[\"'](\w+)")
+CELL_STYLE = re.compile(rb"\ss\s*=\s*[\"'](\d+)")
+
+MS_PER_DAY = 86_400_000
+
+
+class Tokens(NamedTuple):
+    """Regular expressions for the worksheet xml, for a given namespace prefix."""
+
+    row_or_cell: Pattern[bytes]
+    value: Pattern[bytes]
+    text: Pattern[bytes]
+    phonetic: Pattern[bytes]
+
+
+@lru_cache()
+def tokens(prefix: bytes = b"") -> Tokens:
+    """Compile the worksheet tokens.
+
+    Row start tags and complete cells are matched in one go. Cells in the canonical
+    form written by Excel and most libraries, <c r="A1" s="1" t="s"><v>0</v></c>, are
+    split into column letters, style, type and value by the expression itself. Any
+    other cell markup (formulas, inline strings, other attributes) is matched as a
+    whole and picked apart separately.
+    """
+    p = re.escape(prefix)
+    return Tokens(
+        row_or_cell=re.compile(
+            rb"<" + p + rb"(?:"
+            rb"(r)ow(?=[\s/>])([^>]*)"
+            rb'|c r="([A-Z]+)\d+"(?: s="(\d+)")?(?: t="(\w+)")?'
+            rb"(?:/>|><" + p + rb"v>([^<]*)</" + p + rb"v></" + p + rb"c>)"
+            rb"|c(?=[\s/>])([^>]*?)(?:/>|>(.*?)</" + p + rb"c>)"
+            rb")",
+            re.DOTALL,
+        ),
+        value=re.compile(rb"<" + p + rb"v(?:\s[^>]*)?>(.*?)</" + p + rb"v>", re.DOTALL),
+        text=re.compile(rb"<" + p + rb"t(?:\s[^>]*)?>(.*?)</" + p + rb"t>", re.DOTALL),
+        phonetic=re.compile(rb"<" + p + rb"rPh\b.*?</" + p + rb"rPh>", re.DOTALL),
+    )
+
+
+class TablePart(NamedTuple):
+    """Location of a table in a workbook archive."""
+
+    sheet: str
+    path: str
+    table: Table
+
+    @property
+    def ref(self) -> str:
+        return self.table.ref
+
+    @property
+    def columns(self) -> List[str]:
+        return [col.name for col in self.table.tableColumns]
+
+
+def _read_manifest(archive: ZipFile) -> Manifest:
+    return Manifest.from_tree(fromstring(archive.read(ARC_CONTENT_TYPES)))
+
+
+def _parse_workbook(archive: ZipFile, manifest: Manifest) -> WorkbookParser:
+    parser = WorkbookParser(
+        archive, _find_workbook_part(manifest).PartName[1:], keep_links=False
+    )
+    parser.parse()
+    return parser
+
+
+def find_tables(
+    archive: ZipFile, parser: Optional[WorkbookParser] = None
+) -> Dict[str, TablePart]:
+    """Find all tables in a workbook archive, without reading any worksheet.
+
+    Only the workbook, relationship and table definition parts are parsed, so this
+    is cheap even for very large workbooks.
+    """
+    if parser is None:
+        parser = _parse_workbook(archive, _read_manifest(archive))
+    members = set(archive.namelist())
+
+    tables = {}
+    for sheet, rel in parser.find_sheets():
+        if "chartsheet" in rel.Type or rel.target not in members:
+            continue
+        rels_path = get_rels_path(rel.target)
+        if rels_path not in members:
+            continue
+        for table_rel in get_dependents(archive, rels_path).find(Table._rel_type):
+            table = Table.from_tree(fromstring(archive.read(table_rel.target)))
+            tables[table.name] = TablePart(sheet.name, rel.target, table)
+    return tables
+
+
+class TableSelection(NamedTuple):
+    """Columns and data rows of a table that are read."""
+
+    columns: List[str]
+    positions: List[int]
+    min_col: int
+    first_row: int
+    last_row: int
+
+
+def select_table(
+    table: Table,
+    usecols: Optional[Iterable[str]] = None,
+    skiprows: int = 0,
+    nrows: Optional[int] = None,
+) -> TableSelection:
+    """Select columns by name and data rows of a table, excluding header and totals.
+
+    The columns stay in table order. Raises a ValueError for unknown columns and
+    for a negative number of rows.
+    """
+    if skiprows < 0 or (nrows is not None and nrows < 0):
+        raise ValueError(
+            f"skiprows and nrows should not be negative, got {skiprows} and {nrows}."
+        )
+    min_col, min_row, _, max_row = range_boundaries(table.ref)
+    names = [col.name for col in table.tableColumns]
+    positions = list(range(len(names)))
+    if usecols is not None:
+        usecols = set(usecols)
+        missing = usecols.difference(names)
+        if missing:
+            raise ValueError(
+                f"Columns {sorted(missing)} are not in table '{table.displayName}'."
+            )
+        positions = [j for j in positions if names[j] in usecols]
+    first_row = min_row + (table.headerRowCount or 0) + skiprows
+    last_row = max_row - (table.totalsRowCount or 0)
+    if nrows is not None:
+        last_row = min(last_row, first_row + nrows - 1)
+    return TableSelection(
+        [names[j] for j in positions], positions, min_col, first_row, last_row
+    )
+
+
+class TableCells:
+    """Collects the cells of a single table while its worksheet is parsed.
+
+    Only the cells of the selected columns and rows are collected, see
+    `select_table`.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        usecols: Optional[Iterable[str]] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+    ):
+        selection = select_table(table, usecols, skiprows, nrows)
+        self.columns = selection.columns
+        self.positions = selection.positions
+        self.min_col = selection.min_col
+        self.first_row = selection.first_row
+        self.last_row = selection.last_row
+        self.nrows = max(0, self.last_row - self.first_row + 1)
+
+        # per column: row positions and raw text of numbers and date serials, and
+        # row positions and decoded values of everything else
+        ncols = len(self.columns)
+        self.number_rows: List[List[int]] = [[] for _ in range(ncols)]
+        self.number_values: List[List[bytes]] = [[] for _ in range(ncols)]
+        self.date_rows: List[List[int]] = [[] for _ in range(ncols)]
+        self.date_values: List[List[bytes]] = [[] for _ in range(ncols)]
+        self.other_rows: List[List[int]] = [[] for _ in range(ncols)]
+        self.other_values: List[list] = [[] for _ in range(ncols)]
+
+    def sinks(self, position: int) -> dict:
+        """Map column letters to the append methods of each column of the table"""
+        return {
+            get_column_letter(self.min_col + self.positions[j]).encode(): (
+                position,
+                self.number_rows[j].append,
+                self.number_values[j].append,
+                self.date_rows[j].append,
+                self.date_values[j].append,
+                self.other_rows[j].append,
+                self.other_values[j].append,
+            )
+            for j in range(len(self.columns))
+        }
+
+    def to_arrays(
+        self,
+        epoch: datetime = WINDOWS_EPOCH,
+        dtypes: Optional[Mapping[str, Any]] = None,
+        values_as_nan: Collection = (),
+        values_as_inf: Collection = (),
+    ) -> Dict[str, np.ndarray]:
+        """Convert the collected cells to one array per column.
+
+        Columns with a numeric or datetime dtype in `dtypes` are decoded straight
+        into a float64 or datetime64[ns] array, with errors as NaN/Inf (NaT).
+        """
+        arrays = {}
+        for j, name in enumerate(self.columns):
+            cells = (
+                self.nrows,
+                self.number_rows[j],
+                self.number_values[j],
+                self.date_rows[j],
+                self.date_values[j],
+                self.other_rows[j],
+                self.other_values[j],
+            )
+            values = None
+            if dtypes and dtypes.get(name) is not None:
+                kind = pandas_dtype(dtypes[name]).kind
+                if kind in "iufM":
+                    values = _typed_column(
+                        *cells, kind == "M", epoch, values_as_nan, values_as_inf
+                    )
+            arrays[name] = _column_array(*cells, epoch) if values is None else values
+        return arrays
+
+
+def _cast_number(value: Union[str, bytes]):
+    "Same as openpyxl: integers stay integers"
+    if isinstance(value, bytes):
+        value = value.decode()
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+def _dates_to_datetime64(serials: np.ndarray, epoch: datetime) -> Optional[np.ndarray]:
+    """Vectorized version of openpyxl.utils.datetime.from_excel.
+
+    Returns None if any serial can not be represented as datetime64[ns], or is a
+    time without a date.
+    """
+    if len(serials) == 0:
+        return serials.astype("datetime64[ns]")
+    if not (serials.min() >= 1 and serials.max() < 100_000):
+        return None
+    days = np.floor(serials)
+    ms = np.round((serials - days) * MS_PER_DAY)
+    if epoch == WINDOWS_EPOCH:
+        # Excel pretends 1900 was a leap year
+        days += serials < 60
+    offset = (days.astype(np.int64) * MS_PER_DAY + ms.astype(np.int64)).astype(
+        "timedelta64[ms]"
+    )
+    return (np.datetime64(epoch, "ns") + offset).astype("datetime64[ns]")
+
+
+def _column_array(
+    nrows: int,
+    number_rows: List[int],
+    number_values: List[bytes],
+    date_rows: List[int],
+    date_values: List[bytes],
+    other_rows: List[int],
+    other_values: list,
+    epoch: datetime,
+) -> np.ndarray:
+    if number_rows and not date_rows and not other_rows:
+        numbers = np.array(number_values, dtype=np.float64)
+        if len(number_rows) == nrows:
+            if np.all(np.floor(numbers) == numbers) and np.all(np.abs(numbers) < 2**53):
+                return numbers.astype(np.int64)
+            return numbers
+        values = np.full(nrows, np.nan)
+        values[number_rows] = numbers
+        return values
+
+    if date_rows and not number_rows and not other_rows:
+        dates = _dates_to_datetime64(np.array(date_values, dtype=np.float64), epoch)
+        if dates is not None:
+            values = np.full(nrows, np.datetime64("NaT"), dtype="datetime64[ns]")
+            values[date_rows] = dates
+            return values
+
+    # mixed or non numeric column, fall back to python objects like openpyxl does
+    values = np.full(nrows, None, dtype=object)
+    if number_rows:
+        values[number_rows] = [_cast_number(v) for v in number_values]
+    if date_rows:
+        values[date_rows] = [from_excel(_cast_number(v), epoch) for v in date_values]
+    if other_rows:
+        values[other_rows] = other_values
+    return values
+
+
+def _row_blocks(source, size: int = 1 << 22) -> Iterator[bytes]:
+    """Read decompressed worksheet xml in blocks that end on a row boundary."""
+    remainder = b""
+    while True:
+        block = source.read(size)
+        if not block:
+            if remainder:
+                yield remainder
+            return
+        block = remainder + block
+        end = len(block)
+        while True:
+            end = block.rfind(b"row>", 0, end)
+            # only split after a closing tag, e.g. </row> or </x:row>
+            if end == -1 or block[block.rfind(b"<", 0, end) + 1] == ord("/"):
+                break
+        if end == -1:
+            remainder = block
+        else:
+            yield block[: end + 4]
+            remainder = block[end + 4 :]
+
+
+def _text(value: bytes) -> str:
+    text = value.decode("utf-8")
+    return unescape(text) if "&" in text else text
+
+
+def _inline_string(body: bytes, tokens: Tokens) -> Optional[str]:
+    texts = tokens.text.findall(tokens.phonetic.sub(b"", body))
+    if not texts:
+        return None
+    return "".join(_text(t) for t in texts)
+
+
+def _typed_column(
+    nrows: int,
+    number_rows: List[int],
+    number_values: List[bytes],
+    date_rows: List[int],
+    date_values: List[bytes],
+    other_rows: List[int],
+    other_values: list,
+    as_datetime: bool,
+    epoch: datetime,
+    values_as_nan: Collection,
+    values_as_inf: Collection,
+) -> Optional[np.ndarray]:
+    """Decode a column straight into a float64 or datetime64[ns] array.
+
+    Numbers and date serials are treated alike. Returns None if the column holds
+    anything but numbers, errors and empty cells.
+    """
+    errors = {
+        **dict.fromkeys(values_as_nan, np.nan),
+        **dict.fromkeys(values_as_inf, np.inf),
+    }
+    try:
+        other = [errors[v] for v in other_values]
+    except (KeyError, TypeError):
+        return None
+
+    serials = np.full(nrows, np.nan)
+    serials[number_rows] = np.array(number_values, dtype=np.float64)
+    serials[date_rows] = np.array(date_values, dtype=np.float64)
+    serials[other_rows] = other
+    if not as_datetime:
+        return serials
+
+    valid = np.isfinite(serials)
+    dates = _dates_to_datetime64(serials[valid], epoch)
+    if dates is None:
+        return None
+    values = np.full(nrows, np.datetime64("NaT"), dtype="datetime64[ns]")
+    values[valid] = dates
+    return values
+
+
+def parse_sheet(
+    source,
+    tables: Sequence[TableCells],
+    shared_strings: Sequence[str],
+    date_styles: Sequence[str] = (),
+    timedelta_styles: Sequence[str] = (),
+    epoch: datetime = WINDOWS_EPOCH,
+):
+    """Collect the cells of `tables` from worksheet xml `source`.
+
+    The xml is tokenized per block of rows with regular expressions, which is several
+    times faster than a generic xml parser for the very regular cell markup. Parsing
+    stops as soon as the last row of the last table has been read.
+    """
+    last = max((t.last_row for t in tables), default=0)
+    date_style_keys = {s.encode() for s in date_styles}
+    timedelta_style_keys = {s.encode() for s in timedelta_styles}
+    sinks_per_active: dict = {}
+
+    cell_tokens: Optional[Tokens] = None
+    sinks: dict = {}
+    offsets: List[int] = []
+    row_number = column = 0
+    for block in _row_blocks(source):
+        if cell_tokens is None:
+            root = ROOT.search(block)
+            cell_tokens = tokens(root.group(1) or b"" if root else b"")
+        for (
+            is_row,
+            row_attributes,
+            letters,
+            style,
+            data_type,
+            value,
+            attributes,
+            body,
+        ) in cell_tokens.row_or_cell.findall(block):
+            if is_row:
+                match = ROW_NUMBER.search(row_attributes)
+                row_number = int(match.group(1)) if match else row_number + 1
+                column = 0
+                if row_number > last:
+                    return
+                active = tuple(
+                    t for t in tables if t.first_row <= row_number <= t.last_row
+                )
+                try:
+                    sinks = sinks_per_active[active]
+                except KeyError:
+                    sinks = sinks_per_active[active] = {
+                        k: v
+                        for i, t in enumerate(active)
+                        for k, v in t.sinks(i).items()
+                    }
+                offsets = [row_number - t.first_row for t in active]
+                continue
+
+            column += 1
+            if not letters:
+                # not in canonical form, find column, style, type and value
+                match = CELL_COLUMN.search(attributes)
+                letters = (
+                    match.group(1) if match else get_column_letter(column).encode()
+                )
+                if letters not in sinks or not body:
+                    continue
+                match = CELL_STYLE.search(attributes)
+                style = match.group(1) if match else b""
+                match = CELL_TYPE.search(attributes)
+                data_type = match.group(1) if match else b""
+                if data_type == b"inlineStr":
+                    value = _inline_string(body, cell_tokens)
+                else:
+                    match = cell_tokens.value.search(body)
+                    value = match.group(1) if match else b""
+
+            sink = sinks.get(letters)
+            if sink is None or not value:
+                continue
+            (
+                position,
+                number_row,
+                number_value,
+                date_row,
+                date_value,
+                other_row,
+                other_value,
+            ) = sink
+            i = offsets[position]
+
+            if not data_type or data_type == b"n":
+                if style in date_style_keys:
+                    if style in timedelta_style_keys:
+                        other_row(i)
+                        other_value(
+                            from_excel(_cast_number(value), epoch, timedelta=True)
+                        )
+                    else:
+                        date_row(i)
+                        date_value(value)
+                else:
+                    number_row(i)
+                    number_value(value)
+            elif data_type == b"s":
+                other_row(i)
+                other_value(shared_strings[int(value)])
+            elif data_type == b"inlineStr":
+                other_row(i)
+                other_value(value)
+            elif data_type == b"b":
+                other_row(i)
+                other_value(value == b"1")
+            elif data_type == b"d":
+                other_row(i)
+                other_value(from_ISO8601(value.decode()))
+            else:  # "str" and "e"
+                other_row(i)
+                other_value(_text(value))
+
+
+class XmlWorkbook:
+    """Workbook level parts needed to decode tables from the worksheet xml."""
+
+    def __init__(self, archive: ZipFile):
+        self.archive = archive
+        manifest = _read_manifest(archive)
+        self.parser = _parse_workbook(archive, manifest)
+        self.epoch = self.parser.wb.epoch
+        strings_part = manifest.find(SHARED_STRINGS)
+        self._strings_path = strings_part.PartName[1:] if strings_part else None
+        self._shared_strings: Optional[List[str]] = None
+        self._stylesheet: Optional[Stylesheet] = None
+        self._tables: Optional[Dict[str, TablePart]] = None
+
+    @property
+    def tables(self) -> Dict[str, TablePart]:
+        if self._tables is None:
+            self._tables = find_tables(self.archive, self.parser)
+        return self._tables
+
+    @property
+    def shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            self._shared_strings = []
+            if self._strings_path is not None:
+                with self.archive.open(self._strings_path) as src:
+                    self._shared_strings = read_string_table(src)
+        return self._shared_strings
+
+    @property
+    def stylesheet(self) -> Optional[Stylesheet]:
+        if self._stylesheet is None and ARC_STYLE in self.archive.namelist():
+            self._stylesheet = Stylesheet.from_tree(
+                fromstring(self.archive.read(ARC_STYLE))
+            )
+        return self._stylesheet
+
+    def read_tables(
+        self,
+        names: Sequence[str],
+        dtypes: Optional[Mapping[str, Any]] = None,
+        values_as_nan: Collection = (),
+        values_as_inf: Collection = (),
+        usecols: Optional[Iterable[str]] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """Decode tables to a dict of column arrays, reading each worksheet once.
+
+        Only the columns in `usecols` and the rows after `skiprows`, up to `nrows`,
+        are decoded.
+        """
+        per_sheet: Dict[str, List[Tuple[str, TableCells]]] = defaultdict(list)
+        for name in names:
+            part = self.tables[name]
+            cells = TableCells(part.table, usecols, skiprows, nrows)
+            per_sheet[part.path].append((name, cells))
+
+        stylesheet = self.stylesheet
+        date_styles: List[str] = []
+        timedelta_styles: List[str] = []
+        if stylesheet is not None:
+            date_styles = [str(s) for s in stylesheet.date_formats]
+            timedelta_styles = [str(s) for s in stylesheet.timedelta_formats]
+
+        decoded = {}
+        for path, sheet_tables in per_sheet.items():
+            with self.archive.open(path) as src:
+                parse_sheet(
+                    src,
+                    [c for _, c in sheet_tables],
+                    self.shared_strings,
+                    date_styles,
+                    timedelta_styles,
+                    self.epoch,
+                )
+            for name, c in sheet_tables:
+                decoded[name] = c.to_arrays(
+                    self.epoch, dtypes, values_as_nan, values_as_inf
+                )
+        return {name: decoded[name] for name in names}
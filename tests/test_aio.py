@@ -0,0 +1,74 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_xlsx_tables import (
+    aread_xlsx_table,
+    aread_xlsx_tables,
+    awrite_xlsx_tables,
+    xlsx_table_to_df,
+)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"a": np.arange(5000), "b": rng.random(5000)})
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+def test_write_and_read(frame, tmp_path):
+    chunks = asyncio.run(
+        collect(awrite_xlsx_tables([(frame, "T")], index=False, chunk_size=4096))
+    )
+    assert len(chunks) > 1 and all(len(c) >= 4096 for c in chunks[:-1])
+    path = tmp_path / "streamed.xlsx"
+    path.write_bytes(b"".join(chunks))
+    pd.testing.assert_frame_equal(xlsx_table_to_df(path, "T"), frame)
+
+    async def body():
+        data = path.read_bytes()
+        for start in range(0, len(data), 1000):
+            yield data[start : start + 1000]
+
+    class Upload:
+        def __init__(self):
+            self.file = BytesIO(path.read_bytes())
+
+        async def read(self, size=-1):
+            return self.file.read(size)
+
+    async def read():
+        with ThreadPoolExecutor(1) as executor:
+            return [
+                await aread_xlsx_table(body(), "T", executor=executor),
+                await aread_xlsx_table(path.read_bytes(), "T", usecols=["b"]),
+                (await aread_xlsx_tables(Upload(), engine="xml"))["T"],
+                await aread_xlsx_table(path, "T"),
+            ]
+
+    first, selected, upload, from_path = asyncio.run(read())
+    pd.testing.assert_frame_equal(first, frame)
+    pd.testing.assert_frame_equal(selected, frame[["b"]])
+    pd.testing.assert_frame_equal(upload, frame)
+    pd.testing.assert_frame_equal(from_path, frame)
+
+
+def test_write_errors_and_early_stop(frame):
+    async def stop_early():
+        chunks = awrite_xlsx_tables([(frame, "T")], index=False, chunk_size=1024)
+        async for _ in chunks:
+            break
+        await chunks.aclose()
+        return True
+
+    assert asyncio.run(stop_early())
+    with pytest.raises(Exception, match="already in use"):
+        asyncio.run(collect(awrite_xlsx_tables([(frame, "T"), (frame, "T")])))
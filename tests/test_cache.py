@@ -0,0 +1,143 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from pandas_xlsx_tables import (
+    MemoryCache,
+    TableCache,
+    df_to_xlsx_table,
+    xlsx_table_to_df,
+    xlsx_tables_to_dfs,
+)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "cached.xlsx"
+    df_to_xlsx_table(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}), "T", path, False)
+    return path
+
+
+def test_hit_and_miss(tmp_path, workbook, monkeypatch):
+    cache = TableCache(tmp_path / "cache")
+    expected = xlsx_table_to_df(workbook, "T")
+    pd.testing.assert_frame_equal(
+        xlsx_table_to_df(workbook, "T", cache=cache), expected
+    )
+    assert len(cache) == 1
+
+    # a hit does not load the workbook
+    with monkeypatch.context() as m:
+        m.setattr("pandas_xlsx_tables.from_xlsx_tables.load_workbook", None)
+        result = xlsx_table_to_df(workbook, "T", cache=cache)
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(cache) == 1
+
+    # other options are other entries
+    result = xlsx_table_to_df(workbook, "T", usecols=["b"], cache=cache)
+    assert list(result.columns) == ["b"]
+    assert xlsx_tables_to_dfs(workbook, cache=cache).keys() == {"T"}
+    assert len(cache) == 3
+
+    # file objects are keyed on their content
+    for _ in range(2):
+        with open(workbook, "rb") as f:
+            pd.testing.assert_frame_equal(
+                xlsx_table_to_df(f, "T", cache=cache), expected
+            )
+    assert len(cache) == 4
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_invalidated_by_saving(tmp_path, workbook):
+    cache = TableCache(tmp_path / "cache")
+    xlsx_table_to_df(workbook, "T", cache=cache)
+    df_to_xlsx_table(pd.DataFrame({"a": [3]}), "T", workbook, False)
+    os.utime(workbook, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert xlsx_table_to_df(workbook, "T", cache=cache)["a"].tolist() == [3]
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = TableCache(tmp_path / "cache", max_bytes=2500)
+    for key in "abc":
+        cache.put(key, b"x" * 1000)
+        time.sleep(0.01)
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    cache.put("d", b"x" * 1000)
+    assert cache.get("b") is not None and cache.get("c") is None
+    assert cache.size <= 2500
+
+
+def test_unreadable_entries_are_misses(tmp_path, workbook, monkeypatch):
+    cache = TableCache(tmp_path / "cache")
+    key = cache.key(workbook, "T")
+    for content in (b"\x80\x04", b"cno_such_module\nTable\n."):
+        with open(cache._path(key), "wb") as f:
+            f.write(content)
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    # entries of other versions are not read
+    for name in ("__version__", "pd.__version__"):
+        with monkeypatch.context() as m:
+            m.setattr(f"pandas_xlsx_tables.cache.{name}", "0.0.0")
+            assert cache.key(workbook, "T") != key
+    assert cache.key(workbook, "T") == key
+
+
+def test_memory_cache(workbook):
+    cache = MemoryCache()
+    expected = xlsx_table_to_df(workbook, "T")
+    first = xlsx_table_to_df(workbook, "T", cache=cache)
+    first.loc[0, "a"] = 100
+    result = xlsx_table_to_df(workbook, "T", cache=cache)
+    pd.testing.assert_frame_equal(result, expected)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert cache.size > 0
+
+    # saving the workbook drops its entries
+    df_to_xlsx_table(pd.DataFrame({"a": [3]}), "T", workbook, False)
+    os.utime(workbook, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert xlsx_tables_to_dfs(workbook, cache=cache)["T"]["a"].tolist() == [3]
+    assert (cache.misses, len(cache)) == (2, 1)
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(
+            pool.map(lambda _: xlsx_tables_to_dfs(workbook, cache=cache), range(8))
+        )
+    assert all(r["T"]["a"].tolist() == [3] for r in results)
+    assert (cache.hits, cache.misses) == (9, 2)
+
+
+def test_memory_cache_options(workbook):
+    cache = MemoryCache()
+    options = [
+        dict(usecols=["b"]),
+        dict(dtypes={"a": float}),
+        dict(index=[0]),
+        dict(skiprows=1, nrows=1),
+    ]
+    for _ in range(2):
+        for kwargs in options:
+            expected = xlsx_table_to_df(workbook, "T", **kwargs)
+            result = xlsx_table_to_df(workbook, "T", cache=cache, **kwargs)
+            pd.testing.assert_frame_equal(result, expected)
+    assert (cache.hits, cache.misses, len(cache)) == (4, 4, 4)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    df = pd.DataFrame({"a": range(100)})
+    cache = MemoryCache(max_bytes=int(df.memory_usage(deep=True).sum()) * 2)
+    for key in "abc":
+        cache.put(key, df)
+    assert cache.get("a") is None and cache.evictions == 1
+    assert cache.get("b") is not None
+    cache.put("d", df)
+    assert cache.get("b") is not None and cache.get("c") is None
+    cache.put("e", pd.concat([df] * 3))
+    assert cache.get("e") is None and len(cache) == 2
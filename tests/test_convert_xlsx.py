@@ -1,16 +1,36 @@
+import logging
 import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from tempfile import TemporaryDirectory
 
 import numpy as np
 import pandas as pd
 import pytest
+import xlsxwriter.workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet.table import Table, TableStyleInfo
 
-from pandas_xlsx_tables import df_to_xlsx_table, dfs_to_xlsx_tables, xlsx_tables_to_dfs
+from pandas_xlsx_tables import (
+    Stats,
+    XlsxTables,
+    df_to_xlsx_table,
+    dfs_to_xlsx_tables,
+    iter_xlsx_table,
+    xlsx_table_to_arrow,
+    xlsx_table_to_df,
+    xlsx_tables_to_arrow,
+    xlsx_tables_to_dfs,
+)
+from pandas_xlsx_tables.from_xlsx_tables import TableNotFound
+from pandas_xlsx_tables.to_xlsx_table import CHUNK_SIZE
 
 Inf = np.inf
 NaN = np.nan
 
+READERS = ({}, {"read_only": True}, {"engine": "xml"})
+
 
 @pytest.fixture
 def cleandir():
@@ -40,6 +60,245 @@ def df():
     return df
 
 
+@pytest.fixture()
+def openpyxl_workbook(cleandir):
+    """Workbook with tables that are not anchored at A1, with empty cells and errors"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "First"
+    ws.append(["not", "part", "of", "a", "table"])
+    ws.append(["a", "b", "c", "d"])
+    ws.append([1, 1.5, "x", datetime(2020, 1, 1)])
+    ws.append([2, None, None, datetime(2020, 1, 2, 3, 4)])
+    ws.append([3, "#N/A", "z", None])
+    table = Table(displayName="Offset", ref="A2:D5")
+    table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium9")
+    ws.add_table(table)
+
+    ws = wb.create_sheet("Second")
+    ws["C3"], ws["D3"] = "h1", "h2"
+    ws["C4"], ws["D4"] = 1, "q"
+    ws["C6"], ws["D6"] = 3, "r"
+    ws["C7"], ws["D7"] = "total", None
+    ws.add_table(Table(displayName="Gaps", ref="C3:D7", totalsRowCount=1))
+    wb.save("openpyxl.xlsx")
+    return "openpyxl.xlsx"
+
+
+class TestFromXlsx:
+    @pytest.mark.parametrize("reader", READERS[1:])
+    def test_streaming_matches_full_load(self, openpyxl_workbook, reader):
+        expected = xlsx_tables_to_dfs(openpyxl_workbook)
+        result = xlsx_tables_to_dfs(openpyxl_workbook, **reader)
+        assert list(expected) == list(result) == ["Offset", "Gaps"]
+        for name, df in expected.items():
+            pd.testing.assert_frame_equal(df, result[name])
+        assert result["Gaps"]["h1"].tolist()[::2] == [1, 3]
+
+    @pytest.mark.parametrize("reader", READERS)
+    def test_errors_and_empty_cells(self, openpyxl_workbook, reader):
+        result = xlsx_table_to_df(openpyxl_workbook, "Offset", **reader)
+        assert result["b"].dtype == np.float64
+        np.testing.assert_array_equal(result["b"], [1.5, NaN, NaN])
+        assert result["c"].tolist() == ["x", "", "z"]
+        assert result["d"].isna().tolist() == [False, False, True]
+
+    @pytest.mark.parametrize("reader", READERS)
+    def test_dtypes(self, openpyxl_workbook, reader):
+        dtypes = {"a": "int32", "b": "float32", "c": "category", "d": "datetime64[ns]"}
+        result = xlsx_table_to_df(openpyxl_workbook, "Offset", dtypes=dtypes, **reader)
+        assert result.dtypes.astype(str).to_dict() == {**dtypes, "c": "category"}
+        assert result["c"].tolist()[::2] == ["x", "z"]
+        assert result["c"].isna().tolist() == [False, True, False]
+
+        dtypes = {"b": "int64", "c": float}
+        with pytest.raises(ValueError, match="Column 'b' can not be converted"):
+            xlsx_table_to_df(openpyxl_workbook, "Offset", dtypes=dtypes, **reader)
+        result = xlsx_table_to_df(
+            openpyxl_workbook, "Offset", dtypes=dtypes, errors="coerce", **reader
+        )
+        assert result["b"].dtype == result["c"].dtype == np.float64
+        assert result["c"].isna().all()
+
+        # integer dtypes never truncate
+        with pytest.raises(ValueError, match="values that are not integers"):
+            xlsx_table_to_df(
+                openpyxl_workbook, "Offset", dtypes={"b": "Int64"}, **reader
+            )
+        result = xlsx_table_to_df(
+            openpyxl_workbook,
+            "Offset",
+            dtypes={"b": "Int64"},
+            errors="coerce",
+            **reader,
+        )
+        assert result["b"].dtype == "Int64" and result["b"].isna().all()
+
+        # missing values stay missing, or raise if the dtype can not hold them
+        with pytest.raises(ValueError, match='use "boolean"'):
+            xlsx_table_to_df(openpyxl_workbook, "Offset", dtypes={"c": bool}, **reader)
+        result = xlsx_table_to_df(
+            openpyxl_workbook, "Offset", dtypes={"c": str}, **reader
+        )
+        assert result["c"].tolist()[::2] == ["x", "z"]
+        assert result["c"].isna().tolist() == [False, True, False]
+
+    @pytest.mark.parametrize("reader", READERS)
+    def test_table_not_found(self, openpyxl_workbook, reader):
+        pd.testing.assert_frame_equal(
+            xlsx_table_to_df(openpyxl_workbook, "Gaps", **reader),
+            xlsx_tables_to_dfs(openpyxl_workbook)["Gaps"],
+        )
+        with pytest.raises(TableNotFound, match="Choose from"):
+            xlsx_table_to_df(openpyxl_workbook, "Missing", **reader)
+
+    @pytest.mark.parametrize("reader", READERS)
+    def test_select_columns_and_rows(self, openpyxl_workbook, reader):
+        expected = xlsx_table_to_df(openpyxl_workbook, "Offset", **reader)
+        result = xlsx_table_to_df(
+            openpyxl_workbook, "Offset", usecols=["d", "b"], **reader
+        )
+        pd.testing.assert_frame_equal(result, expected[["b", "d"]])
+
+        result = xlsx_table_to_df(openpyxl_workbook, "Offset", nrows=2, **reader)
+        pd.testing.assert_frame_equal(result, expected.iloc[:2])
+        result = xlsx_table_to_df(
+            openpyxl_workbook, "Offset", skiprows=1, nrows=1, **reader
+        )
+        assert result["a"].tolist() == [2] and result["c"].tolist() == [""]
+
+        result = xlsx_tables_to_dfs(openpyxl_workbook, nrows=0, **reader)
+        assert len(result["Offset"]) == len(result["Gaps"]) == 0
+        assert list(result["Gaps"].columns) == ["h1", "h2"]
+
+        result = xlsx_table_to_df(
+            openpyxl_workbook, "Gaps", usecols=["h2"], skiprows=2, **reader
+        )
+        assert result["h2"].tolist() == ["r"]
+
+        with pytest.raises(ValueError, match=r"\['e'\] are not in table 'Offset'"):
+            xlsx_table_to_df(openpyxl_workbook, "Offset", usecols=["a", "e"], **reader)
+        for rows in (dict(skiprows=-1), dict(nrows=-1)):
+            with pytest.raises(ValueError, match="should not be negative"):
+                xlsx_table_to_df(openpyxl_workbook, "Offset", **rows, **reader)
+
+    def test_iter_table(self, openpyxl_workbook):
+        expected = xlsx_table_to_df(openpyxl_workbook, "Offset", index=False)
+        chunks = list(iter_xlsx_table(openpyxl_workbook, "Offset", 2, index=False))
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        # the empty cell in the second chunk keeps the datetime dtype of the first
+        assert chunks[1]["d"].dtype == expected["d"].dtype
+        # integers are inferred as floats, later chunks may not be integers
+        assert chunks[0]["a"].dtype == np.float64
+        pd.testing.assert_frame_equal(pd.concat(chunks), expected.astype({"a": float}))
+
+        chunks = iter_xlsx_table(openpyxl_workbook, "Gaps", 1, usecols=["h1"])
+        assert [chunk["h1"].tolist()[0] for chunk in chunks][::2] == [1, 3]
+        chunks = iter_xlsx_table(
+            openpyxl_workbook, "Gaps", 1, dtypes={"h1": "Int64"}, usecols=["h1"]
+        )
+        assert [chunk["h1"].tolist()[0] for chunk in chunks][::2] == [1, 3]
+        with pytest.raises(ValueError, match="Column 'h1' can not be converted"):
+            list(iter_xlsx_table(openpyxl_workbook, "Gaps", 1, dtypes={"h1": int}))
+        chunks = list(iter_xlsx_table(openpyxl_workbook, "Gaps", nrows=0))
+        assert len(chunks) == 1 and list(chunks[0].columns) == ["h1", "h2"]
+
+        with pytest.raises(TableNotFound, match="Choose from"):
+            next(iter_xlsx_table(openpyxl_workbook, "Missing"))
+        with pytest.raises(ValueError, match="chunksize"):
+            next(iter_xlsx_table(openpyxl_workbook, "Offset", 0))
+
+    def test_iter_table_does_not_truncate(self, cleandir):
+        pd.DataFrame({"a": [1, 2, 2.5, 3]}).to_excel("numbers.xlsx", index=False)
+        wb = load_workbook("numbers.xlsx")
+        wb.active.add_table(Table(displayName="Numbers", ref="A1:A5"))
+        wb.save("numbers.xlsx")
+        chunks = iter_xlsx_table("numbers.xlsx", "Numbers", 2, index=False)
+        assert [chunk["a"].tolist() for chunk in chunks] == [[1, 2], [2.5, 3]]
+        with pytest.raises(ValueError, match="can not be converted"):
+            list(iter_xlsx_table("numbers.xlsx", "Numbers", 2, dtypes={"a": int}))
+
+    @pytest.mark.parametrize("engine", ("openpyxl", "xml"))
+    def test_workers(self, openpyxl_workbook, engine):
+        expected = xlsx_tables_to_dfs(openpyxl_workbook)
+        result = xlsx_tables_to_dfs(openpyxl_workbook, engine=engine, workers=2)
+        assert list(result) == list(expected)
+        for name, df in expected.items():
+            pd.testing.assert_frame_equal(result[name], df)
+
+    @pytest.mark.parametrize("engine", ("openpyxl", "xml"))
+    def test_lazy_tables(self, openpyxl_workbook, engine):
+        expected = xlsx_tables_to_dfs(openpyxl_workbook)
+        with XlsxTables(openpyxl_workbook, engine=engine) as tables:
+            assert sorted(tables) == ["Gaps", "Offset"]
+            assert "Gaps" in tables and "Missing" not in tables
+            assert tables.index["Gaps"].sheet == "Second"
+            assert tables.index["Gaps"].ref == "C3:D7"
+            assert tables.index["Offset"].columns == ["a", "b", "c", "d"]
+            pd.testing.assert_frame_equal(tables["Offset"], expected["Offset"])
+            pd.testing.assert_frame_equal(tables.read("Gaps"), expected["Gaps"])
+            assert tables.read_all().keys() == expected.keys()
+            with pytest.raises(TableNotFound, match="Choose from"):
+                tables["Missing"]
+
+
+class TestArrow:
+    def test_read_arrow(self, openpyxl_workbook):
+        pa = pytest.importorskip("pyarrow")
+        expected = xlsx_tables_to_dfs(openpyxl_workbook, index=False)
+        result = xlsx_tables_to_arrow(openpyxl_workbook)
+        assert result.keys() == expected.keys()
+        for name, table in result.items():
+            assert isinstance(table, pa.Table)
+            pd.testing.assert_frame_equal(table.to_pandas(), expected[name])
+        table = xlsx_table_to_arrow(
+            openpyxl_workbook, "Offset", dtypes={"c": float}, errors="coerce"
+        )
+        assert table.schema.field("c").type == pa.float64()
+
+    def test_read_arrow_mixed(self, cleandir):
+        pa = pytest.importorskip("pyarrow")
+        wb = Workbook()
+        ws = wb.active
+        for row in (["mixed", "number"], [1, 1.5], ["a", 2], ["#N/A", None]):
+            ws.append(row)
+        ws.add_table(Table(displayName="Mixed", ref="A1:B4"))
+        wb.save("mixed.xlsx")
+        table = xlsx_table_to_arrow("mixed.xlsx", "Mixed")
+        assert table.schema.field("mixed").type == pa.string()
+        assert table.column("mixed").to_pylist() == ["1", "a", None]
+        assert table.column("number").to_pylist()[:2] == [1.5, 2]
+
+    def test_write_arrow(self, df, cleandir):
+        pa = pytest.importorskip("pyarrow")
+        df = df.reset_index()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        dfs_to_xlsx_tables(
+            [
+                (table, "ArrowTable"),
+                (table.to_batches(max_chunksize=2), "ArrowBatches"),
+                (df, "Frame"),
+            ],
+            "arrow.xlsx",
+            index=False,
+        )
+        result = xlsx_tables_to_dfs("arrow.xlsx")
+        pd.testing.assert_frame_equal(result["ArrowTable"], result["Frame"])
+        pd.testing.assert_frame_equal(result["ArrowBatches"], result["Frame"])
+
+    def test_write_arrow_ignores_index(self, cleandir):
+        pa = pytest.importorskip("pyarrow")
+        rows = CHUNK_SIZE * 2 + 5
+        table = pa.table({"a": range(rows)})
+        for workers in (None, 2):
+            dfs_to_xlsx_tables(
+                [(table, "Arrow"), (table, "Other")], "arrow.xlsx", workers=workers
+            )
+            result = xlsx_tables_to_dfs("arrow.xlsx")["Arrow"]
+            assert list(result.columns) == ["a"]
+            assert result["a"].tolist() == list(range(rows))
+
+
 @pytest.mark.usefixtures("cleandir")
 class TestToXlsx:
     def test_write_df_to_xlsx_table(self, df):
@@ -55,6 +314,22 @@ class TestToXlsx:
             "test_multiple.xlsx",
         )
 
+    @pytest.mark.parametrize("constant_memory", (True, False))
+    def test_shared_strings_count(self, df, constant_memory):
+        tables = ((df, "TestTable1"), (df, "TestTable2"))
+        dfs_to_xlsx_tables(tables, "test_sst.xlsx", constant_memory=constant_memory)
+        with zipfile.ZipFile("test_sst.xlsx") as archive:
+            references = sum(
+                archive.read(f"xl/worksheets/sheet{i}.xml").count(b't="s"')
+                for i in (1, 2)
+            )
+            if constant_memory:
+                # all strings are inline
+                assert "xl/sharedStrings.xml" not in archive.namelist()
+                return
+            sst = archive.read("xl/sharedStrings.xml").decode()
+        assert f'count="{references}"' in sst
+
 
 @pytest.mark.usefixtures("cleandir")
 class TestRoundtrip:
@@ -87,6 +362,8 @@ class TestRoundtrip:
             r[-Inf] = r[Inf]
         assert df.replace(r).equals(result.replace(r))
 
+    @pytest.mark.parametrize("constant_memory", (True, False))
+    @pytest.mark.parametrize("reader", READERS)
     @pytest.mark.parametrize("nan_inf_to_errors", (True, False))
     @pytest.mark.parametrize("index", (True, False))
     @pytest.mark.parametrize(
@@ -96,7 +373,9 @@ class TestRoundtrip:
             ["int", "A very long header", "scientific", "datetime", "date"],
         ),
     )
-    def test_roundtrip_multiple_tables(self, df, nan_inf_to_errors, index, columns):
+    def test_roundtrip_multiple_tables(
+        self, df, nan_inf_to_errors, index, columns, reader, constant_memory
+    ):
         df = df[columns]
         if not index:
             df = df.reset_index(drop=True)
@@ -106,9 +385,10 @@ class TestRoundtrip:
             "test_multiple.xlsx",
             nan_inf_to_errors=nan_inf_to_errors,
             index=index,
+            constant_memory=constant_memory,
         )
 
-        result = xlsx_tables_to_dfs("test_multiple.xlsx")["TestTable2"]
+        result = xlsx_tables_to_dfs("test_multiple.xlsx", **reader)["TestTable2"]
         assert df.columns.equals(result.columns)
         assert df.index.equals(result.index)
 
@@ -124,6 +404,172 @@ class TestRoundtrip:
             r[-Inf] = r[Inf]
         assert df.replace(r).equals(result.replace(r))
 
+    @pytest.mark.parametrize("constant_memory", (True, False))
+    @pytest.mark.parametrize("index", (True, False))
+    def test_roundtrip_chunks(self, df, index, constant_memory):
+        chunks = (df.iloc[start : start + 2] for start in range(0, len(df), 2))
+        dfs_to_xlsx_tables(
+            ((chunks, "Chunked"), (df, "Whole")),
+            "test_chunks.xlsx",
+            index=index,
+            constant_memory=constant_memory,
+        )
+        with XlsxTables("test_chunks.xlsx") as tables:
+            assert tables.index["Chunked"].ref == tables.index["Whole"].ref
+            pd.testing.assert_frame_equal(tables["Chunked"], tables["Whole"])
+
+        with pytest.raises(ValueError, match="No data for table 'Empty'"):
+            dfs_to_xlsx_tables([(iter(()), "Empty")], "test_empty.xlsx")
+
+    @pytest.mark.parametrize("header_orientation", ("horizontal", "diagonal"))
+    def test_roundtrip_workers(self, df, header_orientation):
+        chunks = (df.iloc[start : start + 2] for start in range(0, len(df), 2))
+        tables = [(df, "First"), (chunks, "Second"), (df.reset_index(), "Third")]
+        options = dict(
+            header_orientation=header_orientation, column_formats={"int": "0.0"}
+        )
+        dfs_to_xlsx_tables(tables[::2], "sequential.xlsx", **options)
+        dfs_to_xlsx_tables(tables, "parallel.xlsx", workers=2, **options)
+
+        expected = xlsx_tables_to_dfs("sequential.xlsx")
+        result = xlsx_tables_to_dfs("parallel.xlsx")
+        assert list(result) == ["First", "Second", "Third"]
+        pd.testing.assert_frame_equal(result["First"], expected["First"])
+        pd.testing.assert_frame_equal(result["Second"], expected["First"])
+        pd.testing.assert_frame_equal(result["Third"], expected["Third"])
+        ws = load_workbook("parallel.xlsx")["Third"]
+        assert ws["C2"].number_format == "0.0"
+        assert ws.tables["Third"].ref == "A1:G6"
+
+        bad = [df.iloc[:2], df.iloc[2:, :2]]
+        with pytest.raises(ValueError, match="should have the same columns"):
+            dfs_to_xlsx_tables(
+                [(df, "Good"), (bad, "Bad")], "bad.xlsx", workers=2, **options
+            )
+
+    def test_compression(self, df):
+        big = pd.concat([df.reset_index()] * 200, ignore_index=True)
+        sizes = {}
+        for compression in ("store", "fast", "max", 4, None):
+            file = f"{compression}.xlsx"
+            dfs_to_xlsx_tables([(big, "Big")], file, compression=compression)
+            sizes[compression] = os.path.getsize(file)
+            with zipfile.ZipFile(file) as archive:
+                methods = {info.compress_type for info in archive.infolist()}
+            stored = compression == "store"
+            assert methods == {zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED}
+        assert sizes["store"] > sizes["fast"] >= sizes["max"]
+        assert sizes["max"] <= sizes[None]
+        pd.testing.assert_frame_equal(
+            xlsx_table_to_df("store.xlsx", "Big"), xlsx_table_to_df("None.xlsx", "Big")
+        )
+
+        # the compression is per workbook, also when closed concurrently
+        with ThreadPoolExecutor(2) as pool:
+            list(
+                pool.map(
+                    lambda c: df_to_xlsx_table(df, "T", f"{c}.xlsx", compression=c),
+                    ("store", None),
+                )
+            )
+        with zipfile.ZipFile("None.xlsx") as archive:
+            assert archive.infolist()[0].compress_type == zipfile.ZIP_DEFLATED
+        # other users of xlsxwriter are left alone
+        assert xlsxwriter.workbook.ZipFile is zipfile.ZipFile
+
+        with pytest.raises(ValueError, match="Invalid compression 'zstd'"):
+            df_to_xlsx_table(df, "T", "bad.xlsx", compression="zstd")
+
+    @pytest.mark.parametrize("constant_memory", (True, False))
+    def test_strings(self, constant_memory):
+        n = 20
+        df = pd.DataFrame(
+            {
+                "id": [f"id{i}" for i in range(n)],
+                "category": pd.Categorical([None, "b", "c", "a"] * (n // 4)),
+                "code": ["x", "y"] * (n // 2),
+                "number": range(n),
+            }
+        )
+        expected = df.assign(category=df.category.astype(object).fillna(""))
+        strings_cells = 3 * n - n // 4
+        cases = [
+            (None, strings_cells if constant_memory else 0),
+            ("shared", 0),
+            ("inline", strings_cells),
+            ("auto", n),
+            # columns that are not named are left to xlsxwriter
+            ({"code": "inline"}, strings_cells if constant_memory else n),
+        ]
+        for strings, inline_cells in cases:
+            df_to_xlsx_table(
+                df,
+                "Strings",
+                index=False,
+                strings=strings,
+                constant_memory=constant_memory,
+            )
+            result = xlsx_table_to_df("Strings.xlsx", "Strings", index=False)
+            pd.testing.assert_frame_equal(result, expected)
+            with zipfile.ZipFile("Strings.xlsx") as archive:
+                sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+            # headers are written inline with constant_memory
+            headers = len(df.columns) if constant_memory else 0
+            assert sheet.count('t="inlineStr"') == inline_cells + headers, strings
+
+        with pytest.raises(ValueError, match="Invalid string storage 'unique'"):
+            df_to_xlsx_table(df, "Strings", strings={"id": "unique"})
+
+    @pytest.mark.parametrize("index", (["name"], ["name", "int"]))
+    def test_roundtrip_index_levels(self, df, index):
+        df = df.reset_index().set_index(index)
+        df_to_xlsx_table(df, "index_levels")
+        result = xlsx_table_to_df("index_levels.xlsx", "index_levels", index=False)
+        expected = df.reset_index()
+        assert list(result.columns) == list(expected.columns)
+        assert (result[index] == expected[index]).all().all()
+
+    @pytest.mark.parametrize("constant_memory", (True, False))
+    def test_roundtrip_typed_columns(self, constant_memory):
+        df = pd.DataFrame(
+            {
+                "int": [1, 2, 3],
+                "float": [1.5, NaN, 3.25],
+                "bool": [True, False, True],
+                "datetime": pd.to_datetime(["2000-01-01 12:00", None, "2021-1-2"]),
+            }
+        )
+        df_to_xlsx_table(
+            df, "typed_columns", index=False, constant_memory=constant_memory
+        )
+        result = xlsx_table_to_df("typed_columns.xlsx", "typed_columns")
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_column_formats(self, df):
+        column_formats = {"int": "#,##0", "scientific": {"num_format": "0.00%"}}
+        dfs_to_xlsx_tables(
+            [(df, "First"), (df, "Second")],
+            "column_formats.xlsx",
+            column_formats=column_formats,
+        )
+        wb = load_workbook("column_formats.xlsx")
+        for ws in wb.worksheets:
+            assert ws["B2"].number_format == "#,##0"
+            assert ws["D3"].number_format == "0.00%"
+        assert len({xf.numFmtId for xf in wb._cell_styles}) == len(wb._cell_styles)
+
+    @pytest.mark.parametrize(
+        "header_orientation", ("horizontal", "vertical", "diagonal")
+    )
+    def test_header_orientation(self, df, header_orientation):
+        df_to_xlsx_table(df, "orientation", header_orientation=header_orientation)
+        ws = load_workbook("orientation.xlsx")["orientation"]
+        if header_orientation == "horizontal":
+            assert ws.column_dimensions["C"].width >= 18
+            assert ws.column_dimensions["E"].width >= 19
+        else:
+            assert ws.row_dimensions[1].height > 15
+
     def test_write_dates_with_timezone(self):
         df = pd.DataFrame(
             pd.date_range("2021-10-19T21:30:00Z", "2021-10-19T23:30:00Z", freq="30min"),
@@ -148,3 +594,22 @@ class TestRoundtrip:
             "test_write_numeric_header"
         ]
         assert (df.values == result.values).all()
+
+    @pytest.mark.parametrize("reader", READERS)
+    def test_stats(self, df, reader, caplog):
+        stats = Stats()
+        with caplog.at_level(logging.DEBUG, logger="pandas_xlsx_tables"):
+            df_to_xlsx_table(df, "Stats", index=False, stats=stats)
+        phases = stats.to_frame().set_index("phase")
+        assert list(phases.index) == ["formats", "widths", "cells", "table", "close"]
+        assert phases.loc["cells", ["rows", "cells"]].tolist() == [5, 25]
+        assert phases.loc["close", "bytes"] == os.path.getsize("Stats.xlsx")
+        assert "Stats cells" in caplog.text
+
+        stats = Stats()
+        xlsx_tables_to_dfs("Stats.xlsx", stats=stats, **reader)
+        phases = stats.to_frame()
+        assert {"decode", "finalize"} <= set(phases["phase"])
+        decoded = phases[phases["phase"] == "decode"]
+        assert decoded[["rows", "cells"]].values.tolist() == [[5, 25]]
+        assert stats.seconds("decode") == decoded["seconds"].sum() > 0
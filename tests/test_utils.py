@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+from xlsxwriter import Workbook
+
+from pandas_xlsx_tables.utils import (
+    MAX_COLUMN_WIDTH,
+    FormatRegistry,
+    column_width,
+    create_format_mapping,
+    datetime_resolution,
+    float_digits,
+)
+
+Inf = np.inf
+NaN = np.nan
+
+
+@pytest.mark.parametrize(
+    "values, digits",
+    (
+        ([1.0, 2.0], 1),
+        ([0.5, 0.25], 2),
+        ([0.1, 0.2, 0.3], 1),
+        ([1.125, NaN], 3),
+        ([1 / 3], 7),
+        ([12e-12, 1.0], None),
+        ([0.0, 1e-7], 7),
+        ([1234567.25], 2),
+        ([123456789.125], None),
+        ([1.5, Inf], 1),
+        ([Inf], None),
+        ([NaN, NaN], 1),
+        ([], 1),
+    ),
+)
+def test_float_digits(values, digits):
+    assert float_digits(np.array(values, dtype=float)) == digits
+
+
+def test_float_digits_sample():
+    values = np.full(10_000, 0.5)
+    values[1] = 0.125
+    assert float_digits(values) == 3
+    assert float_digits(values, sample_size=100) == 1
+
+
+@pytest.mark.parametrize(
+    "values, resolution",
+    (
+        (["2021-01-02", "1850-05-05", None], "date"),
+        (["2021-01-02 10:11", None], "datetime-minutes"),
+        (["1969-12-31 23:59:59", "2021-01-02"], "datetime-seconds"),
+        (["2021-01-02 10:11:12.5"], "datetime-milliseconds"),
+        ([None, None], "date"),
+    ),
+)
+@pytest.mark.parametrize("tz", (None, "Asia/Kolkata"))
+def test_datetime_resolution(values, resolution, tz):
+    col = pd.Series(pd.to_datetime(values))
+    if tz is not None:
+        col = col.dt.tz_localize(tz)
+    assert datetime_resolution(col) == resolution
+
+
+def test_format_registry(tmp_path):
+    wb = Workbook(tmp_path / "formats.xlsx")
+    formats = FormatRegistry(wb)
+    mapping = create_format_mapping(formats)
+    assert formats.add_format("0") is mapping["int"]
+    assert formats.add_format({"num_format": "0.0"}) is mapping["float1"]
+    assert formats.add_format({"bold": True, "num_format": "0"}) is formats.add_format(
+        {"num_format": "0", "bold": True}
+    )
+    assert len(formats) == len(mapping) + 1
+    wb.close()
+
+
+@pytest.mark.parametrize(
+    "values, width",
+    (
+        ([True, False], 5),
+        ([1, -250], 4),
+        ([0.5, 12.25, NaN], 5),
+        ([1.0, 1e-12], 9),
+        (pd.to_datetime(["2021-01-02", "2021-01-03 10:11"]), 16),
+        (["a", "abc", None], 3),
+        (["x" * 100], MAX_COLUMN_WIDTH),
+        ([NaN], 0),
+    ),
+)
+def test_column_width(values, width):
+    assert column_width(pd.Series(values)) == width
+
+
+def test_column_width_sample():
+    col = pd.Series(["a"] * 10_000)
+    col[1] = "abcdef"
+    assert column_width(col) == 1
+    assert column_width(col, sample_size=len(col)) == 6
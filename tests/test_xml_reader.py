@@ -0,0 +1,75 @@
+from datetime import datetime
+from io import BytesIO
+
+import numpy as np
+import pytest
+from openpyxl.worksheet.table import Table, TableColumn
+
+from pandas_xlsx_tables.xml_reader import TableCells, parse_sheet
+
+SHEET = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<{p}worksheet
+  xmlns{colon}{ns}="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<{p}sheetData>
+<{p}row r="1">
+  <{p}c r="B1" t="s"><{p}v>0</{p}v></{p}c>
+  <{p}c r="C1" t="s"><{p}v>1</{p}v></{p}c>
+</{p}row>
+<{p}row r="2" spans="2:3">
+  <{p}c r="A2"><{p}v>99</{p}v></{p}c>
+  <{p}c r="B2" s="1"><{p}v>1</{p}v></{p}c>
+  <{p}c r="C2" t="inlineStr"><{p}is>
+    <{p}r><{p}t>a &amp; </{p}t></{p}r>
+    <{p}r><{p}t xml:space="preserve">b</{p}t></{p}r>
+  </{p}is></{p}c>
+</{p}row>
+<{p}row r="4">
+  <{p}c r="B4"><{p}f>B2*2.5</{p}f><{p}v>2.5</{p}v></{p}c>
+  <{p}c r="C4" t="str"><{p}f>"x"</{p}f><{p}v>&lt;x&gt;</{p}v></{p}c>
+</{p}row>
+<{p}row r="5">
+  <{p}c r="B5" s="2"><{p}v>44197.5</{p}v></{p}c>
+  <{p}c r="C5" t="e"><{p}v>#N/A</{p}v></{p}c>
+</{p}row>
+<{p}row r="6"><{p}c r="B6" t="b"><{p}v>1</{p}v></{p}c><{p}c r="C6"/></{p}row>
+<{p}row r="7"><{p}c r="B7"><{p}v>1000</{p}v></{p}c></{p}row>
+</{p}sheetData>
+</{p}worksheet>"""
+
+
+def table(ref, **kwargs):
+    columns = [TableColumn(id=1, name="num"), TableColumn(id=2, name="text")]
+    return Table(displayName="T", ref=ref, tableColumns=columns, **kwargs)
+
+
+def sheet(prefix):
+    ns = prefix.rstrip(":")
+    return BytesIO(
+        SHEET.format(p=prefix, ns=ns, colon=":" if ns else "").encode("utf-8")
+    )
+
+
+@pytest.mark.parametrize("prefix", ("", "x:"))
+def test_parse_sheet(prefix):
+    cells = TableCells(table("B1:C7", totalsRowCount=1))
+    parse_sheet(sheet(prefix), [cells], ["num", "text"], date_styles=["2"])
+    result = cells.to_arrays()
+
+    assert list(result["num"]) == [1, None, 2.5, datetime(2021, 1, 1, 12), True]
+    assert list(result["text"]) == ["a & b", None, "<x>", "#N/A", None]
+
+
+def test_numeric_columns_are_typed():
+    cells = TableCells(table("B1:C4"))
+    parse_sheet(sheet(""), [cells], ["num", "text"])
+    values = cells.to_arrays()["num"]
+    assert values.dtype == np.float64
+    np.testing.assert_array_equal(values, [1, np.nan, 2.5])
+
+
+def test_dates_are_typed():
+    cells = TableCells(table("B4:C5"))
+    parse_sheet(sheet(""), [cells], ["num", "text"], date_styles=["2"])
+    values = cells.to_arrays()["num"]
+    assert values.dtype == "datetime64[ns]"
+    assert values[0] == np.datetime64("2021-01-01T12:00")